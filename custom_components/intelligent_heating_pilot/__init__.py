@@ -56,7 +56,7 @@ from .infrastructure.adapters import (
     HASchedulerReader,
     HACycleCache,
 )
-from .infrastructure.event_bridge import HAEventBridge
+from .infrastructure.event_bridge import HAEventBridge, build_anticipation_payload
 from .view import async_register_http_views
 
 _LOGGER = logging.getLogger(__name__)
@@ -280,17 +280,7 @@ class IntelligentHeatingPilotCoordinator:
         if anticipation_data:
             self.hass.bus.async_fire(
                 f"{DOMAIN}_anticipation_calculated",
-                {
-                    "entry_id": self.config.entry_id,
-                    "anticipated_start_time": anticipation_data["anticipated_start_time"].isoformat(),
-                    "next_schedule_time": anticipation_data["next_schedule_time"].isoformat(),
-                    "next_target_temperature": anticipation_data["next_target_temperature"],
-                    "anticipation_minutes": anticipation_data["anticipation_minutes"],
-                    "current_temp": anticipation_data["current_temp"],
-                    "learned_heating_slope": anticipation_data["learned_heating_slope"],
-                    "confidence_level": anticipation_data["confidence_level"],
-                    "scheduler_entity": anticipation_data.get("scheduler_entity", ""),
-                },
+                build_anticipation_payload(self.config.entry_id, anticipation_data),
             )
     
     async def async_cleanup(self) -> None:
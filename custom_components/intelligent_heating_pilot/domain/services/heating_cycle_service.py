@@ -2,8 +2,10 @@
 from __future__ import annotations
 
 import logging
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable
 from datetime import datetime, timedelta
-from typing import Any
+from typing import Any, NamedTuple
 
 from ..interfaces.heating_cycle_service import IHeatingCycleService
 from ..value_objects.heating import HeatingCycle, TariffPeriodDetail
@@ -11,6 +13,22 @@ from ..value_objects.historical_data import HistoricalDataKey, HistoricalDataSet
 
 _LOGGER = logging.getLogger(__name__)
 
+# Lower-cased Home Assistant states, matched by set membership in the cycle walk
+_HEATING_HVAC_ACTIONS = frozenset({"heating", "preheating"})
+_HEATING_HVAC_MODES = frozenset({"heat", "heat_cool", "auto"})
+_ACTIVE_STATES = frozenset({"on", "heat", "heating", "true", "1"})
+_ENABLED_STATES = frozenset({"on", "true", "1"})
+
+
+class _CycleSpan(NamedTuple):
+    """Boundaries and temperatures of one detected heating cycle, before splitting."""
+
+    start_time: datetime
+    end_time: datetime
+    start_indoor_temp: float
+    end_indoor_temp: float
+    target_temp: float
+
 
 class HeatingCycleService(IHeatingCycleService):
     """Service to detect and extract heating cycles from a raw historical dataset.
@@ -93,6 +111,42 @@ class HeatingCycleService(IHeatingCycleService):
         # Use provided cycle_split_duration_minutes if specified (>0), otherwise use instance default
         split_duration = cycle_split_duration_minutes if (cycle_split_duration_minutes is not None and cycle_split_duration_minutes > 0) else self._cycle_split_duration_minutes
         
+        # Detect cycle boundaries first, then build (and split) each cycle:
+        # the split duration only affects this O(#cycles) post-pass
+        spans = self._detect_cycle_spans(history_data_set, end_time)
+
+        cycles: list[HeatingCycle] = []
+        for span in spans:
+            cycles.extend(
+                self._create_cycles(
+                    device_id=device_id,
+                    start_time=span.start_time,
+                    end_time=span.end_time,
+                    start_indoor_temp=span.start_indoor_temp,
+                    end_indoor_temp=span.end_indoor_temp,
+                    target_temp=span.target_temp,
+                    history_data_set=history_data_set,
+                    split_duration_minutes=split_duration,
+                )
+            )
+
+        _LOGGER.info("Extracted %d heating cycles", len(cycles))
+        return cycles
+
+    def _detect_cycle_spans(
+        self,
+        history_data_set: HistoricalDataSet,
+        end_time: datetime,
+    ) -> list[_CycleSpan]:
+        """Walk the heating state history and return the boundaries of each heating cycle.
+
+        Args:
+            history_data_set: Dataset containing heating state and temperature histories.
+            end_time: End of the extraction range, used to close an unfinished cycle.
+
+        Returns:
+            Cycle spans in chronological order, not yet validated or split.
+        """
         # Récupérer les données d'historique triées par timestamp
         heating_state_history = sorted(
             history_data_set.data[HistoricalDataKey.HEATING_STATE],
@@ -104,23 +158,39 @@ class HeatingCycleService(IHeatingCycleService):
         cycle_start_indoor_temp: float | None = None
         cycle_start_target_temp: float | None = None
         
-        cycles: list[HeatingCycle] = []       
+        spans: list[_CycleSpan] = []
 
-        for measurement in heating_state_history:
-            timestamp = measurement.timestamp
-            # Separate concerns: mode_on (system enabled) vs action_active (actually heating)
-            mode_on = self._is_mode_on(measurement)
-            action_active = self._is_heating_active(measurement)
+        # Align indoor/target temperatures on the heating state timeline in one
+        # merge pass instead of scanning both histories for every measurement
+        state_times = [m.timestamp for m in heating_state_history]
+        indoor_temps = self._forward_fill(
+            history_data_set.data.get(HistoricalDataKey.INDOOR_TEMP, []), state_times, float
+        )
+        target_temps = self._forward_fill(
+            history_data_set.data.get(HistoricalDataKey.TARGET_TEMP, []), state_times, float
+        )
 
-            current_indoor_temp, current_target_temp = self._get_temperatures_at(
-                history_data_set, timestamp
-            )
+        for measurement, current_indoor_temp, current_target_temp in zip(
+            heating_state_history, indoor_temps, target_temps
+        ):
+            timestamp = measurement.timestamp
 
             if current_indoor_temp is None or current_target_temp is None:
                 _LOGGER.debug("Skipping measurement at %s due to missing temp data", timestamp)
                 continue
 
+            # Separate concerns: mode_on (system enabled) vs action_active (actually heating).
+            # hvac_action only matters while waiting for a cycle to start.
             if heating_start is None:
+                # Idle stretches: skip cheaply unless the room is below target and
+                # heating is active, before parsing the mode attribute
+                if current_target_temp - current_indoor_temp <= self._temp_delta_threshold:
+                    continue
+                action_active = self._is_heating_active(measurement)
+                if not action_active:
+                    continue
+                mode_on = self._is_mode_on(measurement)
+
                 # Check for cycle START condition
                 if self._should_start_cycle(mode_on, action_active, current_indoor_temp, current_target_temp):
                     heating_start = timestamp
@@ -134,24 +204,22 @@ class HeatingCycleService(IHeatingCycleService):
                     )
             else:
                 # Check if cycle should end
+                mode_on = self._is_mode_on(measurement)
                 cycle_ended, end_reason = self._should_end_cycle(
                     mode_on, current_indoor_temp, current_target_temp
                 )
 
                 if cycle_ended:
                     _LOGGER.debug("Heating cycle ended at %s (Reason: %s)", timestamp, end_reason)
-                    created = self._create_cycles(
-                        device_id=device_id,
-                        start_time=heating_start,
-                        end_time=timestamp,
-                        start_indoor_temp=cycle_start_indoor_temp if cycle_start_indoor_temp is not None else current_indoor_temp,
-                        end_indoor_temp=current_indoor_temp,
-                        target_temp=cycle_start_target_temp if cycle_start_target_temp is not None else current_target_temp,
-                        history_data_set=history_data_set,
-                        split_duration_minutes=split_duration,
+                    spans.append(
+                        _CycleSpan(
+                            start_time=heating_start,
+                            end_time=timestamp,
+                            start_indoor_temp=cycle_start_indoor_temp if cycle_start_indoor_temp is not None else current_indoor_temp,
+                            end_indoor_temp=current_indoor_temp,
+                            target_temp=cycle_start_target_temp if cycle_start_target_temp is not None else current_target_temp,
+                        )
                     )
-                    if created:
-                        cycles.extend(created)
                     # Reset for next cycle
                     heating_start = None
                     cycle_start_indoor_temp = None
@@ -160,21 +228,17 @@ class HeatingCycleService(IHeatingCycleService):
         # Gérer un cycle potentiellement non terminé à la fin des données
         if heating_start is not None:
             _LOGGER.debug("Unfinished heating cycle found, ending at data_set end time %s", end_time)
-            created = self._create_cycles(
-                device_id=device_id,
-                start_time=heating_start,
-                end_time=end_time,
-                start_indoor_temp=cycle_start_indoor_temp or 20.0,
-                end_indoor_temp=self._get_value_at_time(history_data_set.data.get(HistoricalDataKey.INDOOR_TEMP, []), end_time, float) or 20.0,
-                target_temp=cycle_start_target_temp or 20.0,
-                history_data_set=history_data_set,
-                split_duration_minutes=split_duration,
+            spans.append(
+                _CycleSpan(
+                    start_time=heating_start,
+                    end_time=end_time,
+                    start_indoor_temp=cycle_start_indoor_temp or 20.0,
+                    end_indoor_temp=self._get_value_at_time(history_data_set.data.get(HistoricalDataKey.INDOOR_TEMP, []), end_time, float) or 20.0,
+                    target_temp=cycle_start_target_temp or 20.0,
+                )
             )
-            if created:
-                cycles.extend(created)
-            
-        _LOGGER.info("Extracted %d heating cycles", len(cycles))
-        return cycles
+
+        return spans
     
     def _is_heating_active(self, measurement: HistoricalMeasurement) -> bool:
         """Determines if the heating system is considered ON from a measurement.
@@ -185,22 +249,12 @@ class HeatingCycleService(IHeatingCycleService):
         attrs = measurement.attributes or {}
         hvac_action = attrs.get("hvac_action")
 
-        if hvac_action:
-            try:
-                if isinstance(hvac_action, str):
-                    action = hvac_action.lower()
-                else:
-                    action = None
-
-                if action in ("heating", "preheating"):
-                    return True
-            except Exception:
-                _LOGGER.debug("Error evaluating hvac_action: %s", attrs, exc_info=True)
+        if isinstance(hvac_action, str) and hvac_action.lower() in _HEATING_HVAC_ACTIONS:
+            return True
 
         # Fallback: non-climate entities (binary sensor, switch) or missing attrs
         if isinstance(measurement.value, str):
-            state = measurement.value.lower()
-            return state in ("on", "heat", "heating", "true", "1")
+            return measurement.value.lower() in _ACTIVE_STATES
         return bool(measurement.value)
 
     def _is_mode_on(self, measurement: HistoricalMeasurement) -> bool:
@@ -213,19 +267,11 @@ class HeatingCycleService(IHeatingCycleService):
         hvac_mode = attrs.get("hvac_mode")
 
         if hvac_mode:
-            try:
-                if isinstance(hvac_mode, str):
-                    mode = hvac_mode.lower()
-                else:
-                    mode = None
-                return mode in ("heat", "heat_cool", "auto")
-            except Exception:
-                _LOGGER.debug("Error evaluating hvac_mode: %s", attrs, exc_info=True)
+            return isinstance(hvac_mode, str) and hvac_mode.lower() in _HEATING_HVAC_MODES
 
         # Fallback for non-climate entities
         if isinstance(measurement.value, str):
-            state = measurement.value.lower()
-            return state in ("on", "true", "1")
+            return measurement.value.lower() in _ENABLED_STATES
         return bool(measurement.value)
 
     def _get_value_at_time(
@@ -255,20 +301,113 @@ class HeatingCycleService(IHeatingCycleService):
                     closest_measurement = measurement
         
         if closest_measurement:
-            try:
-                value_raw: Any = None
-                if attribute_name:
-                    value_raw = closest_measurement.attributes.get(attribute_name)
-                else:
-                    value_raw = closest_measurement.value
-                
-                if value_raw is not None:
-                    return value_type(value_raw)
-            except (ValueError, TypeError):
-                _LOGGER.debug("Could not cast value %s to %s for timestamp %s",
-                              value_raw, value_type.__name__, closest_measurement.timestamp)
+            return self._cast_value(closest_measurement, value_type, attribute_name)
         return None
 
+    def _cast_value(
+        self,
+        measurement: HistoricalMeasurement,
+        value_type: type,
+        attribute_name: str | None = None,
+    ) -> Any | None:
+        """Cast a measurement's value (or one of its attributes) to value_type.
+
+        Returns:
+            The cast value, or None if missing/invalid.
+        """
+        value_raw: Any = None
+        try:
+            if attribute_name:
+                value_raw = measurement.attributes.get(attribute_name)
+            else:
+                value_raw = measurement.value
+            
+            if value_raw is not None:
+                return value_type(value_raw)
+        except (ValueError, TypeError):
+            _LOGGER.debug("Could not cast value %s to %s for timestamp %s",
+                          value_raw, value_type.__name__, measurement.timestamp)
+        return None
+
+    def _value_lookup(
+        self,
+        history: list[HistoricalMeasurement],
+        value_type: type,
+    ) -> Callable[[datetime], Any | None]:
+        """Build a _get_value_at_time equivalent for repeated lookups in one history.
+
+        The history is sorted once; each lookup is then a binary search
+        (O(log N)) instead of a full scan.
+
+        Args:
+            history: List of HistoricalMeasurement records for the entity.
+            value_type: The expected type of the value (e.g., float, str).
+
+        Returns:
+            A function mapping a time to the value at or before it, or None.
+        """
+        samples = sorted(history, key=lambda m: m.timestamp)
+        timestamps = [m.timestamp for m in samples]
+
+        def lookup(target_time: datetime) -> Any | None:
+            index = bisect_right(timestamps, target_time)
+            if index == 0:
+                return None
+            # Keep the first of several measurements sharing a timestamp
+            index = bisect_left(timestamps, timestamps[index - 1])
+            return self._cast_value(samples[index], value_type)
+
+        return lookup
+
+    def _forward_fill(
+        self,
+        history: list[HistoricalMeasurement],
+        query_times: list[datetime],
+        value_type: type,
+    ) -> list[Any | None]:
+        """Get the value at or before each of the ascending query_times.
+
+        Equivalent to calling _get_value_at_time for every query time, but walks
+        the sorted history once alongside the queries (O(N + M) instead of O(N * M)).
+
+        Args:
+            history: List of HistoricalMeasurement records for the entity.
+            query_times: Times to find values for, sorted in ascending order.
+            value_type: The expected type of the values (e.g., float, str).
+
+        Returns:
+            One value per query time, cast to value_type, or None if not found/invalid.
+        """
+        if not history:
+            return [None] * len(query_times)
+
+        # Constant series (typically a target temperature that never changed):
+        # every query at or after the first sample gets the same value
+        first = history[0]
+        if all(m.value == first.value and type(m.value) is type(first.value) for m in history):
+            earliest = min(m.timestamp for m in history)
+            constant_value = self._cast_value(first, value_type)
+            return [constant_value if query_time >= earliest else None for query_time in query_times]
+
+        samples = sorted(history, key=lambda m: m.timestamp)
+        values: list[Any | None] = []
+        closest_measurement: HistoricalMeasurement | None = None
+        closest_value: Any | None = None
+        index = 0
+
+        for query_time in query_times:
+            while index < len(samples) and samples[index].timestamp <= query_time:
+                measurement = samples[index]
+                index += 1
+                # Keep the first of several measurements sharing a timestamp
+                if closest_measurement is not None and measurement.timestamp == closest_measurement.timestamp:
+                    continue
+                closest_measurement = measurement
+                closest_value = self._cast_value(measurement, value_type)
+            values.append(closest_value)
+
+        return values
+
     def _create_cycles(
         self,
         device_id: str,
@@ -297,12 +436,22 @@ class HeatingCycleService(IHeatingCycleService):
             _LOGGER.debug("Skipping invalid cycle due to duration or missing temp data.")
             return []
 
+        # If splitting is enabled, return sub-cycles (used for ML augmentation).
+        # Checked first: the whole-cycle energy and tariff figures below are not
+        # carried by sub-cycles, so there is no point computing them.
+        if split_duration_minutes is not None and split_duration_minutes > 0 and duration_minutes > split_duration_minutes:
+            return self._split_into_cycles(device_id, start_time, end_time, start_indoor_temp, end_indoor_temp, target_temp, history_data_set, split_duration_minutes)
+
         # Compute energy, runtime and tariff breakdown using helper methods
         data = history_data_set.data
         
         total_energy_kwh = self._compute_energy_kwh(data, start_time, end_time)
-        heating_duration_minutes = self._compute_runtime_minutes(
-            data, start_time, end_time, duration_minutes
+        # Whole-cycle runtime only feeds the debug summary below: skip the
+        # scan over the runtime history unless that summary is logged
+        heating_duration_minutes = (
+            self._compute_runtime_minutes(data, start_time, end_time, duration_minutes)
+            if _LOGGER.isEnabledFor(logging.DEBUG)
+            else duration_minutes
         )
         
         tariff_history = data.get(HistoricalDataKey.TARIFF_PRICE_EUR_PER_KWH, [])
@@ -332,10 +481,6 @@ class HeatingCycleService(IHeatingCycleService):
             total_cost_euro,
         )
 
-        # If splitting is enabled, return sub-cycles (used for ML augmentation).
-        if split_duration_minutes is not None and split_duration_minutes > 0 and duration_minutes > split_duration_minutes:
-            return self._split_into_cycles(device_id, start_time, end_time, start_indoor_temp, end_indoor_temp, target_temp, history_data_set, split_duration_minutes)
-
         return [cycle]
 
     def _split_into_cycles(
@@ -367,11 +512,6 @@ class HeatingCycleService(IHeatingCycleService):
 
         temp_per_minute = (end_indoor_temp - start_indoor_temp) / duration_minutes
 
-        current_sub_cycle_start_time = start_time
-        current_sub_cycle_start_temp = start_indoor_temp
-
-        created: list[HeatingCycle] = []
-
         _LOGGER.debug(
             "Splitting cycle from %s to %s (%.1f min) into %d sub-cycles",
             start_time,
@@ -380,39 +520,34 @@ class HeatingCycleService(IHeatingCycleService):
             num_sub_cycles + (1 if remaining_minutes > 0 else 0),
         )
 
-        for i in range(num_sub_cycles):
-            sub_cycle_end_time = current_sub_cycle_start_time + timedelta(minutes=split_duration_minutes)
-            sub_cycle_end_temp = current_sub_cycle_start_temp + (temp_per_minute * split_duration_minutes)
+        # Every full sub-cycle spans the same interval and temperature rise, so
+        # boundaries are computed from their index rather than accumulated
+        split_step = timedelta(minutes=split_duration_minutes)
+        temp_step = temp_per_minute * split_duration_minutes
+        boundary_times = [start_time + split_step * i for i in range(num_sub_cycles + 1)]
+        boundary_temps = [start_indoor_temp + temp_step * i for i in range(num_sub_cycles + 1)]
+
+        # Record remaining part if significant; it ends exactly at the cycle end
+        if remaining_minutes > 0:
+            boundary_times.append(end_time)
+            boundary_temps.append(end_indoor_temp)
 
-            sub_cycle = HeatingCycle(
+        created = [
+            HeatingCycle(
                 device_id=device_id,
-                start_time=current_sub_cycle_start_time,
+                start_time=sub_cycle_start_time,
                 end_time=sub_cycle_end_time,
                 target_temp=target_temp,  # Target remains constant for sub-cycles
                 end_temp=sub_cycle_end_temp,
-                start_temp=current_sub_cycle_start_temp,
-                tariff_details=[],  # TODO: calculate for sub-cycle
+                start_temp=sub_cycle_start_temp,
+                tariff_details=[],  # TODO: calculate for sub-cycles
             )
-            created.append(sub_cycle)
-            _LOGGER.debug("  Created sub-cycle %d: %s", i + 1, sub_cycle)
-
-            current_sub_cycle_start_time = sub_cycle_end_time
-            current_sub_cycle_start_temp = sub_cycle_end_temp
-
-        # Record remaining part if significant
-        if remaining_minutes > 0:
-            remaining_end_time = current_sub_cycle_start_time + timedelta(minutes=remaining_minutes)
-            remaining_cycle = HeatingCycle(
-                device_id=device_id,
-                start_time=current_sub_cycle_start_time,
-                end_time=remaining_end_time,
-                target_temp=target_temp,
-                end_temp=end_indoor_temp,
-                start_temp=current_sub_cycle_start_temp,
-                tariff_details=[],  # TODO: calculate for remaining sub-cycle
+            for sub_cycle_start_time, sub_cycle_end_time, sub_cycle_start_temp, sub_cycle_end_temp in zip(
+                boundary_times, boundary_times[1:], boundary_temps, boundary_temps[1:]
             )
-            created.append(remaining_cycle)
-            _LOGGER.debug("  Created remaining sub-cycle: %s", remaining_cycle)
+        ]
+        for i, sub_cycle in enumerate(created, start=1):
+            _LOGGER.debug("  Created sub-cycle %d: %s", i, sub_cycle)
 
         return created
     
@@ -507,7 +642,12 @@ class HeatingCycleService(IHeatingCycleService):
             return 0.0, []
 
         t_samples = sorted(tariff_history, key=lambda m: m.timestamp)
-        start_price = self._get_value_at_time(t_samples, start_time, float) or 0.0
+        price_at = self._value_lookup(t_samples, float)
+        energy_at = self._value_lookup(energy_history, float)
+        # Runtime snapshots sorted once; each segment then sums a bisected slice
+        runtime_samples = sorted(runtime_history, key=lambda m: m.timestamp)
+        runtime_times = [m.timestamp for m in runtime_samples]
+        start_price = price_at(start_time) or 0.0
         
         # Build segment boundaries at tariff price changes
         boundaries: list[datetime] = [start_time]
@@ -532,23 +672,25 @@ class HeatingCycleService(IHeatingCycleService):
 
         for a, b in zip(boundaries[:-1], boundaries[1:]):
             # Energy consumed in segment (from cumulative meter)
-            start_energy = self._get_value_at_time(energy_history, a, float) or 0.0
-            end_energy = self._get_value_at_time(energy_history, b, float) or 0.0
+            start_energy = energy_at(a) or 0.0
+            end_energy = energy_at(b) or 0.0
             energy_segment = max(0.0, end_energy - start_energy)
 
             # Price applicable at segment start
-            price = self._get_value_at_time(t_samples, a, float) or 0.0
+            price = price_at(a) or 0.0
             cost_segment = energy_segment * price
 
             # Runtime in segment: sum on_time_sec values within [a, b] or use temporal duration
             if runtime_history:
                 segment_runtime_seconds = 0.0
-                for measurement in runtime_history:
-                    if a <= measurement.timestamp < b:
-                        try:
-                            segment_runtime_seconds += float(measurement.value)
-                        except (TypeError, ValueError):
-                            continue
+                segment_samples = runtime_samples[
+                    bisect_left(runtime_times, a):bisect_left(runtime_times, b)
+                ]
+                for measurement in segment_samples:
+                    try:
+                        segment_runtime_seconds += float(measurement.value)
+                    except (TypeError, ValueError):
+                        continue
                 segment_runtime_minutes = segment_runtime_seconds / 60.0 if segment_runtime_seconds > 0.0 else (b - a).total_seconds() / 60.0
             else:
                 segment_runtime_minutes = (b - a).total_seconds() / 60.0
@@ -585,32 +727,6 @@ class HeatingCycleService(IHeatingCycleService):
             if not history_data_set.data.get(key):
                 raise ValueError(f"Missing critical historical data for key: {key.value}")
 
-    def _get_temperatures_at(
-        self,
-        history_data_set: HistoricalDataSet,
-        timestamp: datetime,
-    ) -> tuple[float | None, float | None]:
-        """Get indoor and target temperatures at a given timestamp.
-        
-        Args:
-            history_data_set: Dataset containing temperature histories
-            timestamp: Time to query
-            
-        Returns:
-            Tuple of (indoor_temp, target_temp), either may be None if unavailable
-        """
-        indoor_temp = self._get_value_at_time(
-            history_data_set.data.get(HistoricalDataKey.INDOOR_TEMP, []),
-            timestamp,
-            float,
-        )
-        target_temp = self._get_value_at_time(
-            history_data_set.data.get(HistoricalDataKey.TARGET_TEMP, []),
-            timestamp,
-            float,
-        )
-        return indoor_temp, target_temp
-
     def _should_start_cycle(
         self,
         mode_on: bool,
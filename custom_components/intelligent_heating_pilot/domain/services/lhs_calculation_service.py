@@ -173,25 +173,26 @@ class LHSCalculationService:
             )
             return DEFAULT_HEATING_SLOPE
         
-        # Filter cycles active at target hour
+        # Filter cycles active at target hour (date-agnostic time comparison)
+        target_time = time(hour=target_hour, minute=0, second=0)
+        
         def is_active_at_hour(cycle: HeatingCycle) -> bool:
             """Check if cycle was active during target hour."""
-            # Create time objects for comparison (date-agnostic)
             start_time = cycle.start_time.time()
             end_time = cycle.end_time.time()
-            target_time = time(hour=target_hour, minute=0, second=0)
             
             # Handle same-day cycles
             if cycle.start_time.date() == cycle.end_time.date():
                 return start_time <= target_time < end_time
             
             # Handle multi-day cycles (crosses midnight)
-            # Cycle is active if target_hour is after start AND before end
-            return target_time >= start_time and target_time < end_time
+            # Cycle is active from start until midnight OR from midnight until end
+            return target_time >= start_time or target_time < end_time
         
-        active_cycles = [c for c in heating_cycles if is_active_at_hour(c)]
+        # Collect the slopes of active cycles in the same pass as the filter
+        active_slopes = [c.avg_heating_slope for c in heating_cycles if is_active_at_hour(c)]
         
-        if not active_cycles:
+        if not active_slopes:
             lhs = self.calculate_global_lhs(heating_cycles)
             _LOGGER.debug(
                 "No cycles active at hour %d, using global: %.2f°C/h",
@@ -201,7 +202,7 @@ class LHSCalculationService:
             return lhs
         
         # Calculate simple average
-        avg_slope = sum(cycle.avg_heating_slope for cycle in active_cycles) / len(active_cycles)
+        avg_slope = sum(active_slopes) / len(active_slopes)
         
         if avg_slope <= 0:
             lhs = self.calculate_global_lhs(heating_cycles)
@@ -219,7 +220,7 @@ class LHSCalculationService:
             _LOGGER.info(
                 "Calculated contextual LHS for hour %d from %d active cycles: %.2f°C/h, capped to %.2f°C/h",
                 target_hour,
-                len(active_cycles),
+                len(active_slopes),
                 avg_slope,
                 capped_slope
             )
@@ -227,7 +228,7 @@ class LHSCalculationService:
             _LOGGER.info(
                 "Calculated contextual LHS for hour %d from %d active cycles: %.2f°C/h",
                 target_hour,
-                len(active_cycles),
+                len(active_slopes),
                 avg_slope
             )
         
@@ -6,8 +6,9 @@ cycle extraction without re-scanning entire recorder history.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import datetime
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
 
 from .heating import HeatingCycle
 
@@ -31,6 +32,10 @@ class CycleCacheData:
     cycles: tuple[HeatingCycle, ...]  # Use tuple for immutability
     last_search_time: datetime
     retention_days: int
+    # Chronological start-time index built in __post_init__ (None when unsorted)
+    _sorted_start_times: tuple[datetime, ...] | None = field(
+        init=False, repr=False, compare=False
+    )
     
     def __post_init__(self) -> None:
         """Validate cache data after initialization."""
@@ -43,6 +48,16 @@ class CycleCacheData:
         # Ensure timestamp is timezone-aware
         if self.last_search_time.tzinfo is None:
             raise ValueError("last_search_time must be timezone-aware (UTC)")
+        
+        # Start times indexed once so time-window queries can bisect instead of
+        # scanning; only usable when cycles are stored in chronological order
+        start_times = tuple(cycle.start_time for cycle in self.cycles)
+        try:
+            is_sorted = all(a <= b for a, b in zip(start_times, start_times[1:]))
+        except TypeError:
+            # Mixed naive/aware start times cannot be ordered; fall back to scanning
+            is_sorted = False
+        object.__setattr__(self, "_sorted_start_times", start_times if is_sorted else None)
     
     @property
     def cycle_count(self) -> int:
@@ -58,7 +73,10 @@ class CycleCacheData:
         Returns:
             List of cycles starting at or after start_time
         """
-        return [cycle for cycle in self.cycles if cycle.start_time >= start_time]
+        start_times = self._sorted_start_times
+        if start_times is None:
+            return [cycle for cycle in self.cycles if cycle.start_time >= start_time]
+        return list(self.cycles[bisect_left(start_times, start_time):])
     
     def get_cycles_within_retention(self, reference_time: datetime) -> list[HeatingCycle]:
         """Get cycles within the retention period from a reference time.
@@ -69,6 +87,5 @@ class CycleCacheData:
         Returns:
             List of cycles within retention period
         """
-        from datetime import timedelta
         cutoff_time = reference_time - timedelta(days=self.retention_days)
-        return [cycle for cycle in self.cycles if cycle.start_time >= cutoff_time]
+        return self.get_cycles_since(cutoff_time)
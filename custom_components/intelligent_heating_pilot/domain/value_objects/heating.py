@@ -40,7 +40,7 @@ class HeatingDecision:
             raise ValueError("SET_TEMPERATURE action requires a target temperature")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TariffPeriodDetail:
     """Represents energy consumption and cost details for a specific tariff period."""
     tariff_price_eur_per_kwh: float
@@ -49,7 +49,7 @@ class TariffPeriodDetail:
     cost_euro: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HeatingCycle:
     """Represents a single heating cycle, encapsulating all its relevant data.
     
@@ -26,7 +26,7 @@ class HistoricalDataKey(Enum):
     # Ajoutez d'autres clés au besoin
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HistoricalMeasurement:
     """Represents a single historical measurement for an entity at a specific timestamp.
     
@@ -6,11 +6,12 @@ to the application service.
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.core import Event, EventStateChangedData, HomeAssistant, callback
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.util import dt as dt_util
+from homeassistant.util.read_only_dict import ReadOnlyDict
 
 from .vtherm_compat import get_vtherm_attribute
 from ..const import VTHERM_ATTR_MAX_CAPACITY_HEAT
@@ -23,6 +24,44 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 
 
+def build_anticipation_payload(
+    entry_id: str | None,
+    anticipation_data: dict[str, Any] | None,
+) -> ReadOnlyDict[str, Any]:
+    """Build the immutable payload of an anticipation_calculated event.
+    
+    The payload is built once per calculation and shared by reference by every
+    listening sensor, so it is frozen to prevent one listener from mutating
+    what the others see. ReadOnlyDict (rather than MappingProxyType) keeps the
+    payload JSON-serializable for the recorder and websocket API.
+    
+    Args:
+        entry_id: Config entry ID used by sensors to filter events
+        anticipation_data: Result of calculate_and_schedule_anticipation, or
+            None to signal sensors to clear their values
+    
+    Returns:
+        Read-only event payload
+    """
+    if not anticipation_data:
+        return ReadOnlyDict({
+            "entry_id": entry_id,
+            "clear_values": True,  # Signal to sensors to clear their values
+        })
+    
+    return ReadOnlyDict({
+        "entry_id": entry_id,
+        "anticipated_start_time": anticipation_data["anticipated_start_time"].isoformat(),
+        "next_schedule_time": anticipation_data["next_schedule_time"].isoformat(),
+        "next_target_temperature": anticipation_data["next_target_temperature"],
+        "anticipation_minutes": anticipation_data["anticipation_minutes"],
+        "current_temp": anticipation_data["current_temp"],
+        "learned_heating_slope": anticipation_data["learned_heating_slope"],
+        "confidence_level": anticipation_data["confidence_level"],
+        "scheduler_entity": anticipation_data.get("scheduler_entity", ""),
+    })
+
+
 class HAEventBridge:
     """Bridges Home Assistant events to application service.
     
@@ -207,32 +246,14 @@ class HAEventBridge:
         """Recalculate anticipation and publish event for sensors."""
         anticipation_data = await self._app_service.calculate_and_schedule_anticipation()
         
+        # Publish event for sensors (clear event when no data, sensors go unknown)
+        self._hass.bus.async_fire(
+            "intelligent_heating_pilot_anticipation_calculated",
+            build_anticipation_payload(self._entry_id, anticipation_data),
+        )
         if anticipation_data:
-            # Publish event for sensors with data
-            self._hass.bus.async_fire(
-                "intelligent_heating_pilot_anticipation_calculated",
-                {
-                    "entry_id": self._entry_id,
-                    "anticipated_start_time": anticipation_data["anticipated_start_time"].isoformat(),
-                    "next_schedule_time": anticipation_data["next_schedule_time"].isoformat(),
-                    "next_target_temperature": anticipation_data["next_target_temperature"],
-                    "anticipation_minutes": anticipation_data["anticipation_minutes"],
-                    "current_temp": anticipation_data["current_temp"],
-                    "learned_heating_slope": anticipation_data["learned_heating_slope"],
-                    "confidence_level": anticipation_data["confidence_level"],
-                    "scheduler_entity": anticipation_data.get("scheduler_entity", ""),
-                },
-            )
             _LOGGER.debug("Published anticipation event for sensors")
         else:
-            # Publish event to clear sensor values (set to unknown)
-            self._hass.bus.async_fire(
-                "intelligent_heating_pilot_anticipation_calculated",
-                {
-                    "entry_id": self._entry_id,
-                    "clear_values": True,  # Signal to sensors to clear their values
-                },
-            )
             _LOGGER.debug("Published clear event for sensors")
     
     def ignore_vtherm_changes_for(self, seconds: int = 10) -> None:
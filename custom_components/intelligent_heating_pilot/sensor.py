@@ -1,6 +1,7 @@
 """Sensor platform for Intelligent Heating Pilot."""
 from __future__ import annotations
 
+from collections.abc import Mapping
 from datetime import datetime
 import logging
 from typing import Any
@@ -86,8 +87,12 @@ class IntelligentHeatingPilotSensorBase(SensorEntity):
             )
         )
 
-    def _handle_anticipation_result(self, data: dict) -> None:
-        """Handle new anticipation result. Override in subclasses."""
+    def _handle_anticipation_result(self, data: Mapping[str, Any]) -> None:
+        """Handle new anticipation result. Override in subclasses.
+        
+        The event payload is shared read-only between all sensors of the
+        entry: subclasses must copy what they keep, never mutate it.
+        """
         pass
 
 
@@ -97,7 +102,18 @@ class IntelligentHeatingPilotAnticipationTimeSensor(IntelligentHeatingPilotSenso
     _attr_name = "Anticipated Start Time"
     _attr_icon = "mdi:clock-start"
     _attr_device_class = SensorDeviceClass.TIMESTAMP  # type: ignore[assignment]
-    
+
+    # Event payload keys exposed as extra state attributes
+    _ATTR_KEYS = (
+        ATTR_NEXT_SCHEDULE_TIME,
+        ATTR_NEXT_TARGET_TEMP,
+        "anticipation_minutes",
+        "current_temp",
+        "scheduler_entity",
+        ATTR_LEARNED_HEATING_SLOPE,
+        "confidence_level",
+    )
+
     def __init__(self, coordinator: Any, config_entry: ConfigEntry, name: str) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, config_entry, name)
@@ -120,7 +136,7 @@ class IntelligentHeatingPilotAnticipationTimeSensor(IntelligentHeatingPilotSenso
         """Return additional attributes."""
         return self._attributes
 
-    def _handle_anticipation_result(self, data: dict) -> None:
+    def _handle_anticipation_result(self, data: Mapping[str, Any]) -> None:
         """Handle new anticipation result."""
         # Clear sensor values when scheduler is disabled or no timeslot is available  
         # This sets the sensor to 'unknown' state and clears all attributes  
@@ -144,24 +160,14 @@ class IntelligentHeatingPilotAnticipationTimeSensor(IntelligentHeatingPilotSenso
                 self._anticipated_start = parsed
             else:
                 self._anticipated_start = anticipated_start
-            # Store attributes - keep next_schedule_time as ISO string for proper serialization
-            next_sched = data.get(ATTR_NEXT_SCHEDULE_TIME)
-            if isinstance(next_sched, str):
-                next_sched_attr = next_sched  # Already ISO string
-            elif isinstance(next_sched, datetime):
-                next_sched_attr = next_sched.isoformat()
-            else:
-                next_sched_attr = None
-            
-            self._attributes = {
-                ATTR_NEXT_SCHEDULE_TIME: next_sched_attr,
-                ATTR_NEXT_TARGET_TEMP: data.get(ATTR_NEXT_TARGET_TEMP),
-                "anticipation_minutes": data.get("anticipation_minutes"),
-                "current_temp": data.get("current_temp"),
-                "scheduler_entity": data.get("scheduler_entity"),
-                ATTR_LEARNED_HEATING_SLOPE: data.get(ATTR_LEARNED_HEATING_SLOPE),
-                "confidence_level": data.get("confidence_level"),  # Phase 4: New from domain
-            }
+            # Copy only our attribute keys out of the shared (read-only) event payload
+            self._attributes = {key: data.get(key) for key in self._ATTR_KEYS}
+            # Keep next_schedule_time as ISO string for proper serialization
+            next_sched = self._attributes[ATTR_NEXT_SCHEDULE_TIME]
+            if isinstance(next_sched, datetime):
+                self._attributes[ATTR_NEXT_SCHEDULE_TIME] = next_sched.isoformat()
+            elif not isinstance(next_sched, str):
+                self._attributes[ATTR_NEXT_SCHEDULE_TIME] = None
             _LOGGER.info("Anticipated start time updated: %s (confidence: %.2f)", 
                         self._anticipated_start, data.get("confidence_level", 0.0))
 
@@ -190,7 +196,7 @@ class IntelligentHeatingPilotAnticipationTimeHmsSensor(IntelligentHeatingPilotSe
     def extra_state_attributes(self) -> dict:
         return self._attributes
 
-    def _handle_anticipation_result(self, data: dict) -> None:
+    def _handle_anticipation_result(self, data: Mapping[str, Any]) -> None:
         # Check if this is a clear event
         if data.get("clear_values"):
             self._time_str = None
@@ -255,7 +261,7 @@ class IntelligentHeatingPilotLearnedSlopeSensor(IntelligentHeatingPilotSensorBas
             ATTR_LEARNED_HEATING_SLOPE: current_lhs,
         }
 
-    def _handle_anticipation_result(self, data: dict) -> None:
+    def _handle_anticipation_result(self, data: Mapping[str, Any]) -> None:
         """Consume learned slope from anticipation event and refresh caches."""
         try:
             lhs = data.get(ATTR_LEARNED_HEATING_SLOPE)
@@ -275,6 +281,9 @@ class IntelligentHeatingPilotNextScheduleSensor(IntelligentHeatingPilotSensorBas
     _attr_icon = "mdi:calendar-clock"
     _attr_device_class = SensorDeviceClass.TIMESTAMP  # type: ignore[assignment]
 
+    # Event payload keys exposed as extra state attributes
+    _ATTR_KEYS = (ATTR_NEXT_TARGET_TEMP, "scheduler_entity")
+
     def __init__(self, coordinator: Any, config_entry: ConfigEntry, name: str) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, config_entry, name)
@@ -297,7 +306,7 @@ class IntelligentHeatingPilotNextScheduleSensor(IntelligentHeatingPilotSensorBas
         """Return additional attributes."""
         return self._attributes
 
-    def _handle_anticipation_result(self, data: dict) -> None:
+    def _handle_anticipation_result(self, data: Mapping[str, Any]) -> None:
         """Handle new anticipation result."""
         # Check if this is a clear event
         if data.get("clear_values"):
@@ -320,10 +329,7 @@ class IntelligentHeatingPilotNextScheduleSensor(IntelligentHeatingPilotSensorBas
                 self._next_schedule = parsed
             else:
                 self._next_schedule = next_schedule
-            self._attributes = {
-                ATTR_NEXT_TARGET_TEMP: data.get(ATTR_NEXT_TARGET_TEMP),
-                "scheduler_entity": data.get("scheduler_entity"),
-            }
+            self._attributes = {key: data.get(key) for key in self._ATTR_KEYS}
             _LOGGER.info("Next schedule time updated: %s", self._next_schedule)
 
 
@@ -351,7 +357,7 @@ class IntelligentHeatingPilotNextScheduleHmsSensor(IntelligentHeatingPilotSensor
     def extra_state_attributes(self) -> dict:
         return self._attributes
 
-    def _handle_anticipation_result(self, data: dict) -> None:
+    def _handle_anticipation_result(self, data: Mapping[str, Any]) -> None:
         # Check if this is a clear event
         if data.get("clear_values"):
             self._time_str = None
@@ -414,7 +420,7 @@ class IntelligentHeatingPilotPredictionConfidenceSensor(IntelligentHeatingPilotS
         """Return additional attributes."""
         return self._attributes
 
-    def _handle_anticipation_result(self, data: dict) -> None:
+    def _handle_anticipation_result(self, data: Mapping[str, Any]) -> None:
         """Handle new anticipation result."""
         # Check if this is a clear event
         if data.get("clear_values"):
@@ -1,6 +1,8 @@
-"""Root conftest.py to setup Python path for all tests."""
+"""Root conftest.py for all tests.
+
+Import paths are configured by ``pythonpath`` in pyproject.toml.
+"""
 import sys
-from pathlib import Path
 
 # Patch sqlite3 to use pysqlite3 (with newer SQLite version) for HA recorder tests
 try:
@@ -10,6 +12,3 @@ try:
 except ImportError:
     pass
 
-# Add repository root to sys.path so that custom_components can be imported
-repo_root = Path(__file__).parent.parent
-sys.path.insert(0, str(repo_root))
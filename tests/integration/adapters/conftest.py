@@ -0,0 +1,32 @@
+"""Fixtures for historical data adapter integration tests."""
+import pytest
+
+from custom_components.intelligent_heating_pilot.infrastructure.adapters.sensor_data_adapter import (
+    SensorDataAdapter,
+)
+from custom_components.intelligent_heating_pilot.infrastructure.adapters.weather_data_adapter import (
+    WeatherDataAdapter,
+)
+
+
+# Keep the recorder on an in-memory SQLite database ("sqlite://"): no file,
+# no fsync on async_wait_recording_done. Pinned here so a test cannot switch
+# to an on-disk database by parametrizing persistent_database.
+@pytest.fixture
+def persistent_database() -> bool:
+    """Never persist the recorder database to disk in adapter tests."""
+    return False
+
+
+# Adapters are stateless views over hass, but hass (and therefore these
+# fixtures) is function-scoped in pytest-homeassistant-custom-component.
+@pytest.fixture
+def sensor_adapter(hass) -> SensorDataAdapter:
+    """SensorDataAdapter bound to the test's hass instance."""
+    return SensorDataAdapter(hass)
+
+
+@pytest.fixture
+def weather_adapter(hass) -> WeatherDataAdapter:
+    """WeatherDataAdapter bound to the test's hass instance."""
+    return WeatherDataAdapter(hass)
@@ -23,6 +23,9 @@ from custom_components.intelligent_heating_pilot.domain.value_objects import (
 )
 
 
+pytestmark = pytest.mark.integration
+
+
 @pytest.mark.usefixtures("recorder_mock")
 async def test_climate_adapter_fetch_real_indoor_temp_history(hass):
     """Test ClimateDataAdapter fetches indoor temperature from real recorded states."""
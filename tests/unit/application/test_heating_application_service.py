@@ -5,11 +5,20 @@ scheduled state when conditions change (anticipated start time moves later).
 """
 from __future__ import annotations
 
+import functools
+from dataclasses import replace
 from datetime import datetime, timezone
+from typing import Any, NamedTuple
 from unittest.mock import AsyncMock, Mock, patch
 import pytest
 
+from custom_components.intelligent_heating_pilot import application as app_module
 from custom_components.intelligent_heating_pilot.application import HeatingApplicationService
+from custom_components.intelligent_heating_pilot.domain.interfaces import (
+    IModelStorage,
+    ISchedulerCommander,
+    ISchedulerReader,
+)
 from custom_components.intelligent_heating_pilot.domain.value_objects import (
     ScheduledTimeslot,
     EnvironmentState,
@@ -18,52 +27,96 @@ from custom_components.intelligent_heating_pilot.domain.value_objects import (
 )
 
 
-def make_aware(dt: datetime) -> datetime:
-    """Make a datetime timezone-aware (UTC)."""
-    return dt.replace(tzinfo=timezone.utc)
+@functools.lru_cache(maxsize=64)
+def make_aware(
+    year: int, month: int, day: int, hour: int, minute: int, second: int = 0
+) -> datetime:
+    """Build a UTC-aware datetime; datetimes are immutable so tests share them."""
+    return datetime(year, month, day, hour, minute, second, tzinfo=timezone.utc)
 
 
-@pytest.fixture
-def mock_adapters():
-    """Create mock adapters for testing."""
-    scheduler_reader = Mock()
-    scheduler_reader.get_next_timeslot = AsyncMock()
-    scheduler_reader.is_scheduler_enabled = AsyncMock(return_value=True)
-    
-    model_storage = Mock()
-    model_storage.get_learned_heating_slope = AsyncMock(return_value=2.0)
-    model_storage.get_all_slope_data = AsyncMock(return_value=[])
-    model_storage.get_cached_global_lhs = AsyncMock(return_value=None)
-    model_storage.set_cached_global_lhs = AsyncMock()
-    model_storage.get_cached_contextual_lhs = AsyncMock(return_value=None)
-    model_storage.set_cached_contextual_lhs = AsyncMock()
-    
-    scheduler_commander = Mock()
-    scheduler_commander.run_action = AsyncMock()
-    scheduler_commander.cancel_action = AsyncMock()
+# Canonical scenario values; value objects are frozen so tests can share them
+TARGET_TIME = make_aware(2025, 1, 15, 6, 30)  # 06:30
+BASE_TIME = make_aware(2025, 1, 15, 4, 0)  # 04:00
+LATER_TIME = make_aware(2025, 1, 15, 4, 45)  # 04:45
+MORNING_TIMESLOT = ScheduledTimeslot(
+    target_time=TARGET_TIME,
+    target_temp=21.0,
+    timeslot_id="morning",
+    scheduler_entity="schedule.heating",
+)
+ENV_COLD = EnvironmentState(
+    indoor_temperature=19.0,
+    outdoor_temp=5.0,
+    indoor_humidity=60.0,
+    cloud_coverage=50.0,
+    timestamp=BASE_TIME,
+)
 
-    
-    climate_commander = Mock()
-    climate_commander.turn_on_heat = AsyncMock()
-    climate_commander.turn_off = AsyncMock()
-    climate_commander.set_temperature = AsyncMock()
-    climate_commander.set_hvac_mode = AsyncMock()
-    
+
+def env_at(timestamp: datetime, *, temp: float = 19.0, **changes: Any) -> EnvironmentState:
+    """Snapshot of ENV_COLD at ``timestamp`` with the given indoor temperature."""
+    return replace(ENV_COLD, indoor_temperature=temp, timestamp=timestamp, **changes)
+
+
+# Mutable clock read by the patched dt_util.now() (see fake_clock)
+_clock: dict[str, datetime | None] = {"now": None}
+
+
+def set_now(now: datetime) -> None:
+    """Set the time returned by dt_util.now() in the application layer."""
+    _clock["now"] = now
+
+
+@pytest.fixture(scope="module", autouse=True)
+def fake_clock():
+    """Patch dt_util.now() once for the module; tests move it with set_now()."""
+    with patch.object(app_module.dt_util, "now", side_effect=lambda: _clock["now"]):
+        yield _clock
+
+
+def _apply_default_returns(mock_adapters: dict[str, Mock]) -> None:
+    """Set the return values every test starts from."""
+    mock_adapters["scheduler_reader"].is_scheduler_enabled.return_value = True
+    mock_adapters["model_storage"].get_learned_heating_slope.return_value = 2.0
+    mock_adapters["model_storage"].get_all_slope_data.return_value = []
+    mock_adapters["model_storage"].get_cached_global_lhs.return_value = None
+    mock_adapters["model_storage"].get_cached_contextual_lhs.return_value = None
+    mock_adapters["environment_reader"].is_heating_active.return_value = False
+    mock_adapters["environment_reader"].get_vtherm_slope.return_value = None
+
+
+@pytest.fixture(scope="module")
+def mock_adapters():
+    """Create mock adapters shared by all tests of this module.
+
+    AsyncMock construction is costly, so the mocks are built once and
+    reset between tests by ``reset_mocks``.
+    """
+    # Async-only ports: children of an AsyncMock parent are AsyncMocks
+    scheduler_reader = AsyncMock(spec=ISchedulerReader)
+    model_storage = AsyncMock(spec=IModelStorage)
+    model_storage.get_all_slope_data = AsyncMock()
+    scheduler_commander = AsyncMock(spec=ISchedulerCommander)
+    # No domain interface for these HA adapters; the climate commander is
+    # async-only, the environment reader mostly exposes sync getters
+    climate_commander = AsyncMock()
     environment_reader = Mock()
     environment_reader.get_current_environment = AsyncMock()
-    environment_reader.is_heating_active = AsyncMock(return_value=False)
-    environment_reader.get_vtherm_slope = Mock(return_value=None)
+    environment_reader.is_heating_active = AsyncMock()
     
-    return {
+    adapters = {
         "scheduler_reader": scheduler_reader,
         "model_storage": model_storage,
         "scheduler_commander": scheduler_commander,
         "climate_commander": climate_commander,
         "environment_reader": environment_reader,
     }
+    _apply_default_returns(adapters)
+    return adapters
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def app_service(mock_adapters):
     """Create HeatingApplicationService with mocked adapters."""
     return HeatingApplicationService(
@@ -76,194 +129,193 @@ def app_service(mock_adapters):
     )
 
 
-class TestRevertLogicWhenAnticipatedStartMoves:
-    """Test suite for issue #16: Revert when anticipated start time changes."""
-    
-    @pytest.mark.asyncio
-    async def test_revert_when_anticipated_start_moves_later(
-        self, app_service, mock_adapters
-    ):
-        """Test that system reverts to current schedule when anticipated start moves later.
-        
-        Scenario from issue #16:
-        1. Pre-heating starts at 04:00 with LHS=2°C/h
-        2. During heating, LHS improves to 4°C/h
-        3. Anticipated start recalculates to 05:00 (later than now=04:45)
-        4. System should revert to current scheduled temperature
-        """
-        # Setup: Schedule at 06:30, target temp 21°C
-        base_time = make_aware(datetime(2025, 1, 15, 4, 0, 0))  # 04:00
-        target_time = make_aware(datetime(2025, 1, 15, 6, 30, 0))  # 06:30
-        
-        timeslot = ScheduledTimeslot(
-            target_time=target_time,
-            target_temp=21.0,
-            timeslot_id="morning",
-            scheduler_entity="schedule.heating",
-        )
-        
-        environment = EnvironmentState(
-            indoor_temperature=19.0,
-            outdoor_temp=5.0,
-            indoor_humidity=60.0,
-            cloud_coverage=50.0,
-            timestamp=base_time,
-        )
-        
-        mock_adapters["scheduler_reader"].get_next_timeslot.return_value = timeslot
-        mock_adapters["environment_reader"].get_current_environment.return_value = environment
-        mock_adapters["model_storage"].get_learned_heating_slope.return_value = 1.0
-        
-        # Step 1: Initial calculation triggers pre-heating at 04:00
-        # Mock dt_util.now() to return base_time
-        with patch("custom_components.intelligent_heating_pilot.application.dt_util.now", return_value=base_time):
-            # LHS=2°C/h → anticipated start = 04:00 (in past, so trigger now)
-            await app_service.calculate_and_schedule_anticipation()
-        
-        # Verify pre-heating was triggered
-        mock_adapters["scheduler_commander"].run_action.assert_called_once()
-        assert app_service._is_preheating_active is True
-        assert app_service._preheating_target_time == target_time
-        
-        # Step 2: Time advances to 04:45, LHS improves to 4°C/h
-        later_time = make_aware(datetime(2025, 1, 15, 4, 45, 0))  # 04:45
-        environment_later = EnvironmentState(
-            indoor_temperature=20.0,  # Heated up
-            outdoor_temp=5.0,
-            indoor_humidity=60.0,
-            cloud_coverage=50.0,
-            timestamp=later_time,
-        )
-        
-        mock_adapters["environment_reader"].get_current_environment.return_value = environment_later
-        mock_adapters["model_storage"].get_learned_heating_slope.return_value = 4.0
-        mock_adapters["scheduler_commander"].run_action.reset_mock()
-        
-        # Step 3: Recalculate - anticipated start now 05:00 (later than 04:45)
-        # With better LHS, needs less time → should STOP heating
-        with patch("custom_components.intelligent_heating_pilot.application.dt_util.now", return_value=later_time):
-            await app_service.calculate_and_schedule_anticipation()
-        
-        # Verify system reverted to current schedule
-        mock_adapters["scheduler_commander"].cancel_action.assert_called_once()
-        assert app_service._is_preheating_active is False
-        assert app_service._preheating_target_time is target_time
-        
-        # Verify we did NOT trigger another run_action (that would restart heating)
-        mock_adapters["scheduler_commander"].run_action.assert_not_called()
-    
-    @pytest.mark.asyncio
-    async def test_continue_heating_when_still_needed(
-        self, app_service, mock_adapters
-    ):
-        """Test that system continues heating when anticipated start is still in past."""
-        base_time = make_aware(datetime(2025, 1, 15, 4, 0, 0))
-        target_time = make_aware(datetime(2025, 1, 15, 6, 30, 0))
-        
-        timeslot = ScheduledTimeslot(
-            target_time=target_time,
-            target_temp=21.0,
-            timeslot_id="morning",
-            scheduler_entity="schedule.heating",
-        )
-        
-        environment = EnvironmentState(
-            indoor_temperature=19.0,
-            outdoor_temp=5.0,
-            indoor_humidity=60.0,
-            cloud_coverage=50.0,
-            timestamp=base_time,
-        )
-        
-        mock_adapters["scheduler_reader"].get_next_timeslot.return_value = timeslot
-        mock_adapters["environment_reader"].get_current_environment.return_value = environment
-        mock_adapters["model_storage"].get_learned_heating_slope.return_value = 0.5
-        
-        # Initial calculation - low LHS means early start
-        with patch("custom_components.intelligent_heating_pilot.application.dt_util.now", return_value=base_time):
-            await app_service.calculate_and_schedule_anticipation()
-        
-        assert app_service._is_preheating_active is True
-        
-        # Time advances but LHS stays low - still need heating
-        later_time = make_aware(datetime(2025, 1, 15, 6, 00, 0))
-        environment_later = EnvironmentState(
-            indoor_temperature=19.5,
-            outdoor_temp=5.0,
-            indoor_humidity=60.0,
-            cloud_coverage=50.0,
-            timestamp=later_time,
-        )
-        
-        mock_adapters["environment_reader"].get_current_environment.return_value = environment_later
-        mock_adapters["scheduler_commander"].cancel_action.reset_mock()
-        mock_adapters["scheduler_commander"].run_action.reset_mock()
-        
-        # Recalculate - should continue heating
-        with patch("custom_components.intelligent_heating_pilot.application.dt_util.now", return_value=later_time):
-            await app_service.calculate_and_schedule_anticipation()
-        
-        # Should NOT revert (cancel not called) and not re-trigger run_action
-        mock_adapters["scheduler_commander"].cancel_action.assert_not_called()
-        mock_adapters["scheduler_commander"].run_action.assert_not_called()
-        assert app_service._is_preheating_active is True
-    
-    @pytest.mark.asyncio
-    async def test_mark_preheating_complete_when_target_time_reached(
-        self, app_service, mock_adapters
-    ):
-        """Test that pre-heating state is cleared when target time is reached."""
-        base_time = make_aware(datetime(2025, 1, 15, 4, 0, 0))
-        target_time = make_aware(datetime(2025, 1, 15, 6, 30, 0))
-        
-        timeslot = ScheduledTimeslot(
-            target_time=target_time,
-            target_temp=21.0,
-            timeslot_id="morning",
-            scheduler_entity="schedule.heating",
-        )
-        
-        environment = EnvironmentState(
-            indoor_temperature=19.0,
-            outdoor_temp=5.0,
-            indoor_humidity=60.0,
-            cloud_coverage=50.0,
-            timestamp=base_time,
-        )
-        
-        mock_adapters["scheduler_reader"].get_next_timeslot.return_value = timeslot
-        mock_adapters["environment_reader"].get_current_environment.return_value = environment
-        mock_adapters["model_storage"].get_learned_heating_slope.return_value = 0.5
-        
-        # Start pre-heating
-        with patch("custom_components.intelligent_heating_pilot.application.dt_util.now", return_value=base_time):
-            await app_service.calculate_and_schedule_anticipation()
-        assert app_service._is_preheating_active is True
-        
-        # Time reaches target
-        environment_at_target = EnvironmentState(
-            indoor_temperature=21.0,
-            outdoor_temp=5.0,
-            indoor_humidity=60.0,
-            cloud_coverage=50.0,
-            timestamp=target_time,  # Reached target time
-        )
-        
-        mock_adapters["environment_reader"].get_current_environment.return_value = environment_at_target
-        
-        # Recalculate at target time
-        with patch("custom_components.intelligent_heating_pilot.application.dt_util.now", return_value=target_time):
-            await app_service.calculate_and_schedule_anticipation()
-        
-        # Pre-heating should be marked complete
-        assert app_service._is_preheating_active is False
-        assert app_service._preheating_target_time is None
+@pytest.fixture(autouse=True)
+def reset_mocks(mock_adapters, app_service):
+    """Reset shared mocks and anticipation state before each test."""
+    for adapter in mock_adapters.values():
+        adapter.reset_mock(return_value=True, side_effect=True)
+    _apply_default_returns(mock_adapters)
+    app_service._clear_anticipation_state()
+    _clock["now"] = None
+
+
+class Step(NamedTuple):
+    """One recalculation: clock, environment and learned slope at that time."""
+
+    now: datetime
+    environment: EnvironmentState
+    slope: float = 2.0
+    active_after: bool | None = None  # None = not checked after this step
+
+
+class Scenario(NamedTuple):
+    """A calculate_and_schedule_anticipation() sequence and its outcome.
+
+    Expectations left as None (``...`` for the target time) are not asserted.
+    """
+
+    steps: tuple[Step, ...]
+    timeslot: ScheduledTimeslot | None = MORNING_TIMESLOT
+    scheduler_enabled: bool = True
+    heating_active: bool = False
+    # Pre-heating state before the first step: (is_active, target_time)
+    initial_state: tuple[bool, datetime | None] = (False, None)
+    expected_run: int | None = None
+    expected_cancel: int | None = None
+    expected_active: bool | None = None
+    expected_target_time: Any = ...
+
+
+def _at(hour: int, minute: int) -> datetime:
+    """Aware datetime on the scenario day (2025-01-15)."""
+    return make_aware(2025, 1, 15, hour, minute)
+
+
+SCENARIOS = [
+    # Issue #16: pre-heating starts at 04:00 with a low LHS; at 04:45 the LHS
+    # has improved to 4°C/h, the anticipated start (05:00) is later than now
+    # and the system must revert to the current schedule without re-triggering.
+    pytest.param(
+        Scenario(
+            steps=(
+                Step(BASE_TIME, ENV_COLD, slope=1.0, active_after=True),
+                Step(
+                    LATER_TIME,
+                    env_at(LATER_TIME, temp=20.0),
+                    slope=4.0,
+                ),
+            ),
+            expected_run=1,
+            expected_cancel=1,
+            expected_active=False,
+            expected_target_time=TARGET_TIME,
+        ),
+        id="revert_when_anticipated_start_moves_later",
+    ),
+    # Low LHS keeps the anticipated start in the past: keep heating
+    pytest.param(
+        Scenario(
+            steps=(
+                Step(BASE_TIME, ENV_COLD, slope=0.5, active_after=True),
+                Step(
+                    _at(6, 0),
+                    env_at(_at(6, 0), temp=19.5),
+                    slope=0.5,
+                ),
+            ),
+            expected_run=1,
+            expected_cancel=0,
+            expected_active=True,
+        ),
+        id="continue_heating_when_still_needed",
+    ),
+    pytest.param(
+        Scenario(
+            steps=(
+                Step(BASE_TIME, ENV_COLD, slope=0.5, active_after=True),
+                Step(
+                    TARGET_TIME,
+                    env_at(TARGET_TIME, temp=21.0),
+                    slope=0.5,
+                ),
+            ),
+            expected_active=False,
+            expected_target_time=None,
+        ),
+        id="mark_preheating_complete_when_target_time_reached",
+    ),
+    pytest.param(
+        Scenario(
+            steps=(Step(BASE_TIME, ENV_COLD),),
+            timeslot=None,
+            expected_run=0,
+            expected_cancel=0,
+            expected_active=False,
+            expected_target_time=None,
+        ),
+        id="no_timeslot_no_action",
+    ),
+    pytest.param(
+        Scenario(
+            steps=(Step(BASE_TIME, ENV_COLD),),
+            scheduler_enabled=False,
+            expected_run=0,
+            expected_cancel=0,
+            expected_active=False,
+            expected_target_time=None,
+        ),
+        id="scheduler_disabled_no_action",
+    ),
+    pytest.param(
+        Scenario(
+            steps=(
+                Step(_at(5, 45), env_at(_at(5, 45), temp=20.0)),
+            ),
+            heating_active=True,
+            initial_state=(True, None),
+            expected_run=0,
+            expected_cancel=0,
+        ),
+        id="heating_already_active_no_duplicate_start",
+    ),
+    pytest.param(
+        Scenario(
+            steps=(
+                Step(
+                    _at(7, 0),
+                    env_at(_at(7, 0), temp=21.2, indoor_humidity=55.0, cloud_coverage=40.0),
+                ),
+            ),
+            initial_state=(True, TARGET_TIME),
+            expected_active=False,
+            expected_target_time=None,
+        ),
+        id="past_target_clears_state",
+    ),
+    # Recalculating shortly after the trigger must not call run_action again
+    pytest.param(
+        Scenario(
+            steps=(
+                Step(_at(5, 0), env_at(_at(5, 0)), active_after=True),
+                Step(_at(5, 5), env_at(_at(5, 5), temp=19.2)),
+            ),
+            expected_run=1,
+        ),
+        id="no_duplicate_run_action_when_preheating_active",
+    ),
+]
+
+
+@pytest.mark.parametrize("scenario", SCENARIOS)
+async def test_anticipation_scenario(app_service, mock_adapters, scenario: Scenario):
+    """Drive calculate_and_schedule_anticipation() through a scenario's steps."""
+    mock_adapters["scheduler_reader"].get_next_timeslot.return_value = scenario.timeslot
+    mock_adapters["scheduler_reader"].is_scheduler_enabled.return_value = scenario.scheduler_enabled
+    mock_adapters["environment_reader"].is_heating_active.return_value = scenario.heating_active
+    app_service._is_preheating_active, app_service._preheating_target_time = scenario.initial_state
+
+    for step in scenario.steps:
+        mock_adapters["environment_reader"].get_current_environment.return_value = step.environment
+        mock_adapters["model_storage"].get_learned_heating_slope.return_value = step.slope
+        set_now(step.now)
+        await app_service.calculate_and_schedule_anticipation()
+        if step.active_after is not None:
+            assert app_service._is_preheating_active is step.active_after
+
+    commander = mock_adapters["scheduler_commander"]
+    if scenario.expected_run is not None:
+        assert commander.run_action.call_count == scenario.expected_run
+    if scenario.expected_cancel is not None:
+        assert commander.cancel_action.call_count == scenario.expected_cancel
+    if scenario.expected_active is not None:
+        assert app_service._is_preheating_active is scenario.expected_active
+    if scenario.expected_target_time is not ...:
+        assert app_service._preheating_target_time == scenario.expected_target_time
 
 
 class TestOvershootPrevention:
     """Test suite for overshoot prevention using scheduler."""
     
-    @pytest.mark.asyncio
     async def test_overshoot_uses_scheduler_cancel_not_direct_turnoff(
         self, app_service, mock_adapters
     ):
@@ -271,36 +323,21 @@ class TestOvershootPrevention:
         
         This is the fix for issue #16 part 2: Use scheduler instead of direct VTherm control.
         """
-        target_time = make_aware(datetime(2025, 1, 15, 6, 30, 0))
-        current_time = make_aware(datetime(2025, 1, 15, 6, 0, 0))
-        
-        timeslot = ScheduledTimeslot(
-            target_time=target_time,
-            target_temp=21.0,
-            timeslot_id="morning",
-            scheduler_entity="schedule.heating",
-        )
+        current_time = make_aware(2025, 1, 15, 6, 0)
+        environment = env_at(current_time, temp=20.0)  # Already close to target
         
-        environment = EnvironmentState(
-            indoor_temperature=20.0,  # Already close to target
-            outdoor_temp=5.0,
-            indoor_humidity=60.0,
-            cloud_coverage=50.0,
-            timestamp=current_time,
-        )
-        
-        mock_adapters["scheduler_reader"].get_next_timeslot.return_value = timeslot
+        mock_adapters["scheduler_reader"].get_next_timeslot.return_value = MORNING_TIMESLOT
         mock_adapters["environment_reader"].get_current_environment.return_value = environment
         mock_adapters["environment_reader"].get_vtherm_slope.return_value = 3.0  # High heating rate
         
         # Mark as pre-heating active
         app_service._is_preheating_active = True
-        app_service._preheating_target_time = target_time
+        app_service._preheating_target_time = TARGET_TIME
         
         # Check overshoot - will detect overshoot risk
         # (current 20°C + 3°C/h * 0.5h = 21.5°C > threshold 21.5°C)
-        with patch("custom_components.intelligent_heating_pilot.application.dt_util.now", return_value=current_time):
-            await app_service.check_overshoot_risk(scheduler_entity_id=timeslot.scheduler_entity)
+        set_now(current_time)
+        await app_service.check_overshoot_risk(scheduler_entity_id=MORNING_TIMESLOT.scheduler_entity)
         
         # Should use scheduler cancel_action, NOT climate turn_off
         mock_adapters["scheduler_commander"].cancel_action.assert_called_once()
@@ -310,28 +347,13 @@ class TestOvershootPrevention:
         assert app_service._is_preheating_active is False
         assert app_service._preheating_target_time is None
 
-    @pytest.mark.asyncio
     async def test_no_overshoot_check_when_not_preheating(
         self, app_service, mock_adapters
     ):
         """Overshoot check should do nothing when not preheating."""
-        target_time = make_aware(datetime(2025, 1, 15, 6, 30, 0))
-        current_time = make_aware(datetime(2025, 1, 15, 6, 0, 0))
-
-        timeslot = ScheduledTimeslot(
-            target_time=target_time,
-            target_temp=21.0,
-            timeslot_id="morning",
-            scheduler_entity="schedule.heating",
-        )
-        environment = EnvironmentState(
-            indoor_temperature=20.0,
-            outdoor_temp=5.0,
-            indoor_humidity=60.0,
-            cloud_coverage=50.0,
-            timestamp=current_time,
-        )
-        mock_adapters["scheduler_reader"].get_next_timeslot.return_value = timeslot
+        current_time = make_aware(2025, 1, 15, 6, 0)
+        environment = env_at(current_time, temp=20.0)
+        mock_adapters["scheduler_reader"].get_next_timeslot.return_value = MORNING_TIMESLOT
         mock_adapters["environment_reader"].get_current_environment.return_value = environment
         mock_adapters["environment_reader"].get_vtherm_slope.return_value = 3.0
 
@@ -339,8 +361,8 @@ class TestOvershootPrevention:
         app_service._is_preheating_active = False
         app_service._preheating_target_time = None
 
-        with patch("custom_components.intelligent_heating_pilot.application.dt_util.now", return_value=current_time):
-            await app_service.check_overshoot_risk(scheduler_entity_id=timeslot.scheduler_entity)
+        set_now(current_time)
+        await app_service.check_overshoot_risk(scheduler_entity_id=MORNING_TIMESLOT.scheduler_entity)
 
         mock_adapters["scheduler_commander"].cancel_action.assert_not_called()
         mock_adapters["climate_commander"].turn_off.assert_not_called()
@@ -349,7 +371,6 @@ class TestOvershootPrevention:
 class TestNoDirectVThermControl:
     """Test suite ensuring scheduler is used instead of direct VTherm control."""
     
-    @pytest.mark.asyncio
     async def test_preheating_start_uses_only_scheduler(
         self, app_service, mock_adapters
     ):
@@ -357,31 +378,16 @@ class TestNoDirectVThermControl:
         
         This verifies the fix for issue #16: Remove direct climate_commander calls.
         """
-        base_time = make_aware(datetime(2025, 1, 15, 5, 0, 0))
-        target_time = make_aware(datetime(2025, 1, 15, 6, 30, 0))
+        base_time = make_aware(2025, 1, 15, 5, 0)
+        environment = env_at(base_time)
         
-        timeslot = ScheduledTimeslot(
-            target_time=target_time,
-            target_temp=21.0,
-            timeslot_id="morning",
-            scheduler_entity="schedule.heating",
-        )
-        
-        environment = EnvironmentState(
-            indoor_temperature=19.0,
-            outdoor_temp=5.0,
-            indoor_humidity=60.0,
-            cloud_coverage=50.0,
-            timestamp=base_time,
-        )
-        
-        mock_adapters["scheduler_reader"].get_next_timeslot.return_value = timeslot
+        mock_adapters["scheduler_reader"].get_next_timeslot.return_value = MORNING_TIMESLOT
         mock_adapters["environment_reader"].get_current_environment.return_value = environment
         mock_adapters["model_storage"].get_learned_heating_slope.return_value = 2.0
         
         # Calculate and schedule - should trigger pre-heating
-        with patch("custom_components.intelligent_heating_pilot.application.dt_util.now", return_value=base_time):
-            await app_service.calculate_and_schedule_anticipation()
+        set_now(base_time)
+        await app_service.calculate_and_schedule_anticipation()
         
         # Verify scheduler.run_action was called
         mock_adapters["scheduler_commander"].run_action.assert_called_once()
@@ -392,167 +398,9 @@ class TestNoDirectVThermControl:
         mock_adapters["climate_commander"].set_hvac_mode.assert_not_called()
 
 
-class TestAdditionalScenarios:
-    """Additional scenarios to strengthen coverage and prevent regressions."""
-
-    @pytest.mark.asyncio
-    async def test_no_timeslot_no_action(self, app_service, mock_adapters):
-        """No action when scheduler has no next timeslot."""
-        now = make_aware(datetime(2025, 1, 15, 4, 0, 0))
-        mock_adapters["scheduler_reader"].get_next_timeslot.return_value = None
-
-        with patch("custom_components.intelligent_heating_pilot.application.dt_util.now", return_value=now):
-            await app_service.calculate_and_schedule_anticipation()
-
-        mock_adapters["scheduler_commander"].run_action.assert_not_called()
-        mock_adapters["scheduler_commander"].cancel_action.assert_not_called()
-        assert app_service._is_preheating_active is False
-        assert app_service._preheating_target_time is None
-
-    @pytest.mark.asyncio
-    async def test_scheduler_disabled_no_action(self, app_service, mock_adapters):
-        """No action when scheduler is disabled."""
-        now = make_aware(datetime(2025, 1, 15, 4, 0, 0))
-        mock_adapters["scheduler_reader"].is_scheduler_enabled.return_value = False
-
-        target_time = make_aware(datetime(2025, 1, 15, 6, 30, 0))
-        timeslot = ScheduledTimeslot(
-            target_time=target_time,
-            target_temp=21.0,
-            timeslot_id="morning",
-            scheduler_entity="schedule.heating",
-        )
-        environment = EnvironmentState(
-            indoor_temperature=19.0,
-            outdoor_temp=5.0,
-            indoor_humidity=60.0,
-            cloud_coverage=50.0,
-            timestamp=now,
-        )
-        mock_adapters["scheduler_reader"].get_next_timeslot.return_value = timeslot
-        mock_adapters["environment_reader"].get_current_environment.return_value = environment
-
-        with patch("custom_components.intelligent_heating_pilot.application.dt_util.now", return_value=now):
-            await app_service.calculate_and_schedule_anticipation()
-
-        mock_adapters["scheduler_commander"].run_action.assert_not_called()
-        mock_adapters["scheduler_commander"].cancel_action.assert_not_called()
-        assert app_service._is_preheating_active is False
-        assert app_service._preheating_target_time is None
-
-    @pytest.mark.asyncio
-    async def test_heating_already_active_no_duplicate_start(self, app_service, mock_adapters):
-        """Do not trigger scheduler when heating already active."""
-        now = make_aware(datetime(2025, 1, 15, 5, 45, 0))
-        target_time = make_aware(datetime(2025, 1, 15, 6, 30, 0))
-        timeslot = ScheduledTimeslot(
-            target_time=target_time,
-            target_temp=21.0,
-            timeslot_id="morning",
-            scheduler_entity="schedule.heating",
-        )
-        environment = EnvironmentState(
-            indoor_temperature=20.0,
-            outdoor_temp=5.0,
-            indoor_humidity=60.0,
-            cloud_coverage=50.0,
-            timestamp=now,
-        )
-        mock_adapters["scheduler_reader"].get_next_timeslot.return_value = timeslot
-        mock_adapters["environment_reader"].get_current_environment.return_value = environment
-        mock_adapters["environment_reader"].is_heating_active.return_value = True
-        mock_adapters["model_storage"].get_learned_heating_slope.return_value = 2.0
-       
-        with patch("custom_components.intelligent_heating_pilot.application.dt_util.now", return_value=now):
-            app_service._is_preheating_active = True
-            await app_service.calculate_and_schedule_anticipation()
-
-        mock_adapters["scheduler_commander"].run_action.assert_not_called()
-        mock_adapters["scheduler_commander"].cancel_action.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_past_target_clears_state(self, app_service, mock_adapters):
-        """Clear preheating state when now is past target time."""
-        target_time = make_aware(datetime(2025, 1, 15, 6, 30, 0))
-        past_now = make_aware(datetime(2025, 1, 15, 7, 0, 0))
-
-        timeslot = ScheduledTimeslot(
-            target_time=target_time,
-            target_temp=21.0,
-            timeslot_id="morning",
-            scheduler_entity="schedule.heating",
-        )
-        environment = EnvironmentState(
-            indoor_temperature=21.2,
-            outdoor_temp=5.0,
-            indoor_humidity=55.0,
-            cloud_coverage=40.0,
-            timestamp=past_now,
-        )
-        mock_adapters["scheduler_reader"].get_next_timeslot.return_value = timeslot
-        mock_adapters["environment_reader"].get_current_environment.return_value = environment
-
-        # Simulate preheating active
-        app_service._is_preheating_active = True
-        app_service._preheating_target_time = target_time
-
-        with patch("custom_components.intelligent_heating_pilot.application.dt_util.now", return_value=past_now):
-            await app_service.calculate_and_schedule_anticipation()
-
-        assert app_service._is_preheating_active is False
-        assert app_service._preheating_target_time is None
-
-    @pytest.mark.asyncio
-    async def test_no_duplicate_run_action_when_preheating_active(self, app_service, mock_adapters):
-        """Ensure run_action is not called again while preheating is active."""
-        base_time = make_aware(datetime(2025, 1, 15, 5, 0, 0))
-        target_time = make_aware(datetime(2025, 1, 15, 6, 30, 0))
-
-        timeslot = ScheduledTimeslot(
-            target_time=target_time,
-            target_temp=21.0,
-            timeslot_id="morning",
-            scheduler_entity="schedule.heating",
-        )
-        environment = EnvironmentState(
-            indoor_temperature=19.0,
-            outdoor_temp=5.0,
-            indoor_humidity=60.0,
-            cloud_coverage=50.0,
-            timestamp=base_time,
-        )
-        mock_adapters["scheduler_reader"].get_next_timeslot.return_value = timeslot
-        mock_adapters["environment_reader"].get_current_environment.return_value = environment
-        mock_adapters["model_storage"].get_learned_heating_slope.return_value = 2.0
-
-        # Initial trigger
-        with patch("custom_components.intelligent_heating_pilot.application.dt_util.now", return_value=base_time):
-            await app_service.calculate_and_schedule_anticipation()
-        assert app_service._is_preheating_active is True
-        assert mock_adapters["scheduler_commander"].run_action.call_count == 1
-
-        # Recalculate shortly after; should not re-trigger
-        soon = make_aware(datetime(2025, 1, 15, 5, 5, 0))
-        environment_soon = EnvironmentState(
-            indoor_temperature=19.2,
-            outdoor_temp=5.0,
-            indoor_humidity=60.0,
-            cloud_coverage=50.0,
-            timestamp=soon,
-        )
-        mock_adapters["environment_reader"].get_current_environment.return_value = environment_soon
-
-        with patch("custom_components.intelligent_heating_pilot.application.dt_util.now", return_value=soon):
-            await app_service.calculate_and_schedule_anticipation()
-
-        # Still only one trigger
-        assert mock_adapters["scheduler_commander"].run_action.call_count == 1
-
-
 class TestManualSlopeMode:
     """Test suite for manual slope mode feature."""
     
-    @pytest.mark.asyncio
     async def test_manual_slope_mode_returns_manual_value(self, mock_adapters):
         """Test that manual slope mode returns the configured manual value."""
         manual_slope = 3.5
@@ -566,8 +414,7 @@ class TestManualSlopeMode:
             manual_slope_value=manual_slope,
         )
         
-        target_time = make_aware(datetime(2025, 1, 15, 6, 30, 0))
-        lhs = await app_service._get_contextual_lhs(target_time)
+        lhs = await app_service._get_contextual_lhs(TARGET_TIME)
         
         assert lhs == manual_slope
         # Verify that cycle extraction was NOT called (manual mode skips calculation)
@@ -576,7 +423,6 @@ class TestManualSlopeMode:
         # (which would be called in the fallback path)
         mock_adapters["model_storage"].get_learned_heating_slope.assert_not_called()
     
-    @pytest.mark.asyncio
     async def test_manual_slope_mode_disabled_calculates_normally(self, mock_adapters):
         """Test that when manual mode is disabled, LHS is calculated normally."""
         app_service = HeatingApplicationService(
@@ -589,15 +435,13 @@ class TestManualSlopeMode:
             manual_slope_value=5.0,  # This should be ignored
         )
         
-        target_time = make_aware(datetime(2025, 1, 15, 6, 30, 0))
-        
         # Mock that no cycles are found, so it falls back to global LHS
         mock_adapters["model_storage"].get_learned_heating_slope.return_value = 2.0
         
         # Mock cycle extraction to return empty list
         with patch.object(app_service, '_extract_cycles_from_recorder', new_callable=AsyncMock) as mock_extract:
             mock_extract.return_value = []
-            lhs = await app_service._get_contextual_lhs(target_time)
+            lhs = await app_service._get_contextual_lhs(TARGET_TIME)
         
         # Should use global LHS (2.0), not manual value (5.0)
         assert lhs == 2.0
@@ -21,6 +21,9 @@ from custom_components.intelligent_heating_pilot.domain.value_objects import (
     HeatingDecision,
 )
 
+# Fixed clock for deterministic environment snapshots
+NOW = datetime(2024, 1, 1, 12, 0, 0)
+
 
 @pytest.fixture
 def mock_decision_strategy():
@@ -64,7 +67,7 @@ class TestHeatingPilotWithStrategy:
             outdoor_temp=5.0,
             indoor_humidity=50.0,
             cloud_coverage=0.5,
-            timestamp=datetime.now(),
+            timestamp=NOW,
         )
         
         # WHEN: Deciding action
@@ -92,7 +95,7 @@ class TestHeatingPilotWithStrategy:
             outdoor_temp=5.0,
             indoor_humidity=50.0,
             cloud_coverage=0.5,
-            timestamp=datetime.now(),
+            timestamp=NOW,
         )
         
         # WHEN: Checking overshoot
@@ -129,7 +132,7 @@ class TestHeatingPilotWithStrategy:
             outdoor_temp=5.0,
             indoor_humidity=50.0,
             cloud_coverage=0.5,
-            timestamp=datetime.now(),
+            timestamp=NOW,
         )
         
         # WHEN: Using simple strategy
@@ -1,27 +1,29 @@
 """Centralized test fixtures for domain layer tests (DRY principle)."""
+from __future__ import annotations
+
+import functools
+from collections.abc import Callable, Mapping
 from datetime import datetime, timedelta, timezone
-import sys
-import os
-
-# Add custom_components to path for domain imports
-sys.path.insert(
-    0,
-    os.path.join(
-        os.path.dirname(__file__),
-        "../../../custom_components/intelligent_heating_pilot",
-    ),
-)
+from sys import intern
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from domain.value_objects.heating import HeatingCycle
 
-from domain.value_objects.heating import HeatingCycle
+
+# Fixed reference time shared by all domain tests (datetimes are immutable)
+TEST_DATETIME: datetime = datetime(2024, 1, 15, 12, 0, 0)
+_FUTURE_2H: datetime = TEST_DATETIME + timedelta(hours=2)
 
 
 def get_test_datetime() -> datetime:
     """Get a fixed datetime for testing.
     
     Returns:
-        A datetime object representing 2024-01-15 12:00:00
+        TEST_DATETIME (2024-01-15 12:00:00)
     """
-    return datetime(2024, 1, 15, 12, 0, 0)
+    return TEST_DATETIME
 
 
 def get_future_datetime(hours: int = 2) -> datetime:
@@ -33,9 +35,17 @@ def get_future_datetime(hours: int = 2) -> datetime:
     Returns:
         A datetime object in the future
     """
-    return get_test_datetime() + timedelta(hours=hours)
+    return _FUTURE_2H if hours == 2 else TEST_DATETIME + timedelta(hours=hours)
+
 
+# Temperatures shared by every cycle built by create_test_heating_cycle()
+_CYCLE_START_TEMP = 18.0
+_CYCLE_TARGET_MARGIN = 0.5
 
+
+# Cycles are frozen (tariff_details=None), so identical requests can share one
+# instance across the cache, LHS and workflow tests
+@functools.lru_cache(maxsize=256)
 def create_test_heating_cycle(
     device_id: str,
     start_time: datetime,
@@ -53,18 +63,19 @@ def create_test_heating_cycle(
     Returns:
         HeatingCycle object for testing
     """
-    end_time = start_time + timedelta(hours=duration_hours)
-    start_temp = 18.0
-    end_temp = start_temp + temp_increase
-    target_temp = end_temp + 0.5
+    # Imported on first use so modules needing only constants skip the domain
+    # package (the component directory is on sys.path via pytest's pythonpath)
+    from domain.value_objects.heating import HeatingCycle
+
+    end_temp = _CYCLE_START_TEMP + temp_increase
     
     return HeatingCycle(
         device_id=device_id,
         start_time=start_time,
-        end_time=end_time,
-        target_temp=target_temp,
+        end_time=start_time + timedelta(hours=duration_hours),
+        target_temp=end_temp + _CYCLE_TARGET_MARGIN,
         end_temp=end_temp,
-        start_temp=start_temp,
+        start_temp=_CYCLE_START_TEMP,
         tariff_details=None
     )
 
@@ -80,114 +91,167 @@ TEST_CLOUD_COVERAGE = 50.0
 # Test timeslot ID
 TEST_TIMESLOT_ID = "test_timeslot_1"
 
-# Test device IDs
-TEST_DEVICE_ID = "climate.test_vtherm"
-TEST_ENTITY_ID = "climate.living_room"
-TEST_SENSOR_ENTITY_ID = "sensor.indoor_temperature"
-TEST_WEATHER_ENTITY_ID = "weather.home"
+# Test device IDs (interned: dotted IDs are not interned automatically, and
+# these are shared with the mocked history records below)
+TEST_DEVICE_ID = intern("climate.test_vtherm")
+TEST_ENTITY_ID = intern("climate.living_room")
+TEST_SENSOR_ENTITY_ID = intern("sensor.indoor_temperature")
+TEST_WEATHER_ENTITY_ID = intern("weather.home")
+TEST_OUTDOOR_SENSOR_ENTITY_ID = intern("sensor.outdoor_temp")
 
-# Home Assistant historical data responses (mocked)
-MOCK_CLIMATE_HISTORY_RESPONSE = [
-    [
-        {
-            "entity_id": "climate.living_room",
-            "state": "heat",
-            "attributes": {
-                "current_temperature": 18.0,
-                "target_temperature": 21.0,
-                "hvac_action": "heating",
-            },
-            "last_changed": "2024-01-15T12:00:00+00:00",
-            "last_updated": "2024-01-15T12:00:00+00:00",
-        },
-        {
-            "entity_id": "climate.living_room",
-            "state": "heat",
-            "attributes": {
-                "current_temperature": 19.0,
-                "target_temperature": 21.0,
-                "hvac_action": "heating",
-            },
-            "last_changed": "2024-01-15T12:15:00+00:00",
-            "last_updated": "2024-01-15T12:15:00+00:00",
-        },
-        {
-            "entity_id": "climate.living_room",
-            "state": "off",
-            "attributes": {
-                "current_temperature": 21.0,
-                "target_temperature": 21.0,
-                "hvac_action": "idle",
-            },
-            "last_changed": "2024-01-15T12:30:00+00:00",
-            "last_updated": "2024-01-15T12:30:00+00:00",
-        },
-    ]
-]
+HistoryRecord = Mapping[str, Any]
 
-MOCK_SENSOR_HISTORY_RESPONSE = [
-    [
-        {
-            "entity_id": "sensor.outdoor_temp",
-            "state": "5.0",
-            "attributes": {"device_class": "temperature", "unit_of_measurement": "°C"},
-            "last_changed": "2024-01-15T12:00:00+00:00",
-            "last_updated": "2024-01-15T12:00:00+00:00",
-        },
-        {
-            "entity_id": "sensor.outdoor_temp",
-            "state": "6.0",
-            "attributes": {"device_class": "temperature", "unit_of_measurement": "°C"},
-            "last_changed": "2024-01-15T12:15:00+00:00",
-            "last_updated": "2024-01-15T12:15:00+00:00",
-        },
-        {
-            "entity_id": "sensor.outdoor_temp",
-            "state": "7.0",
-            "attributes": {"device_class": "temperature", "unit_of_measurement": "°C"},
-            "last_changed": "2024-01-15T12:30:00+00:00",
-            "last_updated": "2024-01-15T12:30:00+00:00",
-        },
-    ]
-]
 
-MOCK_WEATHER_HISTORY_RESPONSE = [
-    [
-        {
-            "entity_id": "weather.home",
-            "state": "rainy",
-            "attributes": {
-                "temperature": 5.0,
-                "humidity": 75,
-                "cloud_coverage": 80,
-                "weather_state": "rainy",
-            },
-            "last_changed": "2024-01-15T12:00:00+00:00",
-            "last_updated": "2024-01-15T12:00:00+00:00",
-        },
-        {
-            "entity_id": "weather.home",
-            "state": "cloudy",
-            "attributes": {
-                "temperature": 6.0,
-                "humidity": 70,
-                "cloud_coverage": 50,
-                "weather_state": "cloudy",
-            },
-            "last_changed": "2024-01-15T12:30:00+00:00",
-            "last_updated": "2024-01-15T12:30:00+00:00",
-        },
+def _record(
+    entity_id: str,
+    state: str,
+    attributes: dict[str, Any],
+    timestamp: str,
+) -> HistoryRecord:
+    """Build one read-only Home Assistant history record.
+    
+    All records share one key order, so CPython shares their dict keys
+    table. The record and its attributes are MappingProxyType views, so a
+    test cannot mutate the shared MOCK_* constants.
+    """
+    return MappingProxyType({
+        "entity_id": entity_id,
+        "state": state,
+        "attributes": MappingProxyType(attributes),
+        "last_changed": timestamp,
+        "last_updated": timestamp,
+    })
+
+
+def make_climate_record(
+    timestamp: str,
+    current_temperature: float,
+    state: str = "heat",
+    hvac_action: str = "heating",
+    target_temperature: float = TEST_TARGET_TEMP,
+    entity_id: str = TEST_ENTITY_ID,
+) -> HistoryRecord:
+    """Build a read-only climate history record for synthetic series.
+    
+    Args:
+        timestamp: ISO-8601 last_changed/last_updated value
+        current_temperature: Measured room temperature in °C
+        state: HVAC mode state of the climate entity
+        hvac_action: Current hvac_action attribute
+        target_temperature: Setpoint in °C
+        entity_id: Climate entity the record belongs to
+        
+    Returns:
+        A record shaped like MOCK_CLIMATE_HISTORY entries
+    """
+    return _record(
+        entity_id,
+        state,
         {
-            "entity_id": "weather.home",
-            "state": "sunny",
-            "attributes": {
-                "temperature": 7.0,
-                "humidity": 65,
-                "cloud_coverage": 20,
-                "weather_state": "sunny",
-            },
-            "last_changed": "2024-01-15T13:00:00+00:00",
-            "last_updated": "2024-01-15T13:00:00+00:00",
+            "current_temperature": current_temperature,
+            "target_temperature": target_temperature,
+            "hvac_action": hvac_action,
         },
-    ]
+        timestamp,
+    )
+
+
+_TEMP_SENSOR_ATTRS = {"device_class": "temperature", "unit_of_measurement": "°C"}
+
+# Home Assistant state histories (mocked, read-only)
+MOCK_CLIMATE_HISTORY = (
+    make_climate_record("2024-01-15T12:00:00+00:00", 18.0, "heat", "heating"),
+    make_climate_record("2024-01-15T12:15:00+00:00", 19.0, "heat", "heating"),
+    make_climate_record("2024-01-15T12:30:00+00:00", 21.0, "off", "idle"),
+)
+
+MOCK_SENSOR_HISTORY = (
+    _record(TEST_OUTDOOR_SENSOR_ENTITY_ID, "5.0", _TEMP_SENSOR_ATTRS, "2024-01-15T12:00:00+00:00"),
+    _record(TEST_OUTDOOR_SENSOR_ENTITY_ID, "6.0", _TEMP_SENSOR_ATTRS, "2024-01-15T12:15:00+00:00"),
+    _record(TEST_OUTDOOR_SENSOR_ENTITY_ID, "7.0", _TEMP_SENSOR_ATTRS, "2024-01-15T12:30:00+00:00"),
+)
+
+MOCK_WEATHER_HISTORY = (
+    _record(
+        TEST_WEATHER_ENTITY_ID,
+        "rainy",
+        {"temperature": 5.0, "humidity": 75, "cloud_coverage": 80, "weather_state": "rainy"},
+        "2024-01-15T12:00:00+00:00",
+    ),
+    _record(
+        TEST_WEATHER_ENTITY_ID,
+        "cloudy",
+        {"temperature": 6.0, "humidity": 70, "cloud_coverage": 50, "weather_state": "cloudy"},
+        "2024-01-15T12:30:00+00:00",
+    ),
+    _record(
+        TEST_WEATHER_ENTITY_ID,
+        "sunny",
+        {"temperature": 7.0, "humidity": 65, "cloud_coverage": 20, "weather_state": "sunny"},
+        "2024-01-15T13:00:00+00:00",
+    ),
+)
+
+# The same histories in the recorder response shape (one state list per entity)
+MOCK_CLIMATE_HISTORY_RESPONSE = (MOCK_CLIMATE_HISTORY,)
+MOCK_SENSOR_HISTORY_RESPONSE = (MOCK_SENSOR_HISTORY,)
+MOCK_WEATHER_HISTORY_RESPONSE = (MOCK_WEATHER_HISTORY,)
+
+
+# Flat (timestamp, value, state) views of the histories above, parsed once,
+# for tests that only compare series and do not need the HA record shape
+HistoryEvent = tuple[datetime, float, str]
+
+
+def _events(
+    history: tuple[HistoryRecord, ...],
+    value_of: Callable[[HistoryRecord], float],
+) -> tuple[HistoryEvent, ...]:
+    """Flatten a mocked state history."""
+    return tuple(
+        (datetime.fromisoformat(record["last_changed"]), value_of(record), record["state"])
+        for record in history
+    )
+
+
+@functools.cache
+def sensor_events() -> tuple[HistoryEvent, ...]:
+    """Numeric states of MOCK_SENSOR_HISTORY."""
+    return _events(MOCK_SENSOR_HISTORY, lambda r: float(r["state"]))
+
+
+@functools.cache
+def weather_events() -> tuple[HistoryEvent, ...]:
+    """Outdoor temperatures of MOCK_WEATHER_HISTORY."""
+    return _events(MOCK_WEATHER_HISTORY, lambda r: r["attributes"]["temperature"])
+
+
+__all__ = [
+    "TEST_DATETIME",
+    "get_test_datetime",
+    "get_future_datetime",
+    "create_test_heating_cycle",
+    "TEST_CURRENT_TEMP",
+    "TEST_TARGET_TEMP",
+    "TEST_OUTDOOR_TEMP",
+    "TEST_HUMIDITY",
+    "TEST_LEARNED_SLOPE",
+    "TEST_CLOUD_COVERAGE",
+    "TEST_TIMESLOT_ID",
+    "TEST_DEVICE_ID",
+    "TEST_ENTITY_ID",
+    "TEST_SENSOR_ENTITY_ID",
+    "TEST_WEATHER_ENTITY_ID",
+    "TEST_OUTDOOR_SENSOR_ENTITY_ID",
+    "HistoryRecord",
+    "HistoryEvent",
+    "make_climate_record",
+    "MOCK_CLIMATE_HISTORY",
+    "MOCK_SENSOR_HISTORY",
+    "MOCK_WEATHER_HISTORY",
+    "MOCK_CLIMATE_HISTORY_RESPONSE",
+    "MOCK_SENSOR_HISTORY_RESPONSE",
+    "MOCK_WEATHER_HISTORY_RESPONSE",
+    "sensor_events",
+    "weather_events",
 ]
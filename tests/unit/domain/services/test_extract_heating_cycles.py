@@ -1,14 +1,12 @@
 """Integration tests for HeatingCycleService.extract_heating_cycles method."""
-import sys
+import functools
+from collections.abc import Mapping
 from datetime import datetime, timedelta
-from pathlib import Path
+from types import MappingProxyType
+from typing import Any
 
 import pytest
 
-# Add domain to path WITHOUT loading infrastructure layer
-DOMAIN_PATH = Path(__file__).parent.parent.parent.parent.parent / "custom_components" / "intelligent_heating_pilot" / "domain"
-sys.path.insert(0, str(DOMAIN_PATH.parent))
-
 from domain.services.heating_cycle_service import HeatingCycleService
 from domain.value_objects.historical_data import (
     HistoricalDataKey,
@@ -17,19 +15,25 @@ from domain.value_objects.historical_data import (
 )
 
 
-def m(timestamp: datetime, value: float | str | bool, hvac_action: str | None = None, hvac_mode: str | None = None, device_id: str = "test.device") -> HistoricalMeasurement:
-    """Helper to create HistoricalMeasurement with optional climate attributes."""
+@functools.cache
+def _climate_attrs(hvac_action: str | None, hvac_mode: str | None) -> Mapping[str, Any]:
+    """Read-only climate attributes, shared by every measurement with the same action/mode."""
     attrs = {}
     if hvac_action:
         attrs["hvac_action"] = hvac_action
     if hvac_mode:
         attrs["hvac_mode"] = hvac_mode
-    return HistoricalMeasurement(timestamp, value, attrs, device_id)
+    return MappingProxyType(attrs)
+
+
+def m(timestamp: datetime, value: float | str | bool, hvac_action: str | None = None, hvac_mode: str | None = None, device_id: str = "test.device") -> HistoricalMeasurement:
+    """Helper to create HistoricalMeasurement with optional climate attributes."""
+    return HistoricalMeasurement(timestamp, value, _climate_attrs(hvac_action, hvac_mode), device_id)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def service():
-    """Create HeatingCycleService for testing."""
+    """Create HeatingCycleService for testing (stateless, shared by the module)."""
     return HeatingCycleService(
         temp_delta_threshold=0.5,
         cycle_split_duration_minutes=None,
@@ -38,7 +42,7 @@ def service():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def service_with_splitting():
     """Create HeatingCycleService with cycle splitting enabled."""
     return HeatingCycleService(
@@ -49,16 +53,46 @@ def service_with_splitting():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def base_time():
     """Base timestamp for tests."""
     return datetime(2024, 1, 1, 12, 0, 0)
 
 
+@pytest.fixture(scope="module")
+def single_45min_cycle(base_time):
+    """Read-only dataset with one 45-minute cycle from base_time; returns (dataset, end_time).
+
+    Shared by the split parameter tests: the service only reads the dataset.
+    """
+    t0 = base_time
+    t1 = t0 + timedelta(minutes=5)
+    t2 = t0 + timedelta(minutes=45)  # 45-min cycle
+    t3 = t0 + timedelta(minutes=48)
+
+    dataset = HistoricalDataSet(
+        data={
+            HistoricalDataKey.INDOOR_TEMP: [
+                m(t0, 18.0),
+                m(t1, 18.5),
+                m(t2, 20.4),
+                m(t3, 20.4),
+            ],
+            HistoricalDataKey.TARGET_TEMP: [m(t, 20.0) for t in [t0, t1, t2, t3]],
+            HistoricalDataKey.HEATING_STATE: [
+                m(t0, True, hvac_action="heating", hvac_mode="heat"),
+                m(t1, True, hvac_action="heating", hvac_mode="heat"),
+                m(t2, False, hvac_action="off", hvac_mode="heat"),
+                m(t3, False, hvac_action="off", hvac_mode="heat"),
+            ],
+        }
+    )
+    return dataset, t3
+
+
 class TestExtractSingleHeatingCycle:
     """Test extraction of a single complete heating cycle."""
 
-    @pytest.mark.asyncio
     async def test_single_cycle_start_to_end(self, service, base_time):
         """Given a single heating cycle from start to end, extracts one HeatingCycle."""
         # Build timeline: start -> heat for 30 min -> reach target -> stop
@@ -105,7 +139,6 @@ class TestExtractSingleHeatingCycle:
         assert cycle.end_temp == pytest.approx(19.6)
         assert cycle.target_temp == 20.0
 
-    @pytest.mark.asyncio
     async def test_cycle_ends_on_mode_disabled(self, service, base_time):
         """Given heating active but mode disabled, cycle ends."""
         t0 = base_time
@@ -140,7 +173,6 @@ class TestExtractSingleHeatingCycle:
 class TestExtractMultipleCycles:
     """Test extraction of multiple heating cycles with no overlap."""
 
-    @pytest.mark.asyncio
     async def test_two_consecutive_cycles_no_overlap(self, service, base_time):
         """Given two heating cycles in sequence, extracts both without overlap."""
         # Cycle 1: t1-t3 (ends at temperature threshold)
@@ -189,7 +221,6 @@ class TestExtractMultipleCycles:
         # Verify no overlap
         assert cycles[0].end_time <= cycles[1].start_time
 
-    @pytest.mark.asyncio
     async def test_measurements_not_shared_between_cycles(self, service, base_time):
         """Verify that no HistoricalMeasurement timestamp is shared between adjacent cycles."""
         t0 = base_time
@@ -234,7 +265,6 @@ class TestExtractMultipleCycles:
 class TestExtractWithCycleSplitting:
     """Test cycle splitting for ML data augmentation."""
 
-    @pytest.mark.asyncio
     async def test_long_cycle_split_into_subcycles(self, service_with_splitting, base_time):
         """Given cycle longer than split_duration, splits into multiple sub-cycles."""
         # Create a 90-minute cycle that should split into 3 sub-cycles (30 min each)
@@ -273,13 +303,13 @@ class TestExtractWithCycleSplitting:
         # or 3 complete + 1 remainder (90 = 3*30 + 10)
         assert len(cycles) == 4 
         # Verify sub-cycles are contiguous and cover the full time range
-        total_duration = sum(
-            (c.end_time - c.start_time).total_seconds() / 60.0 for c in cycles
-        )
+        total_duration = sum(c.duration_minutes for c in cycles)
         expected_duration = (t4 - t1).total_seconds() / 60.0
         assert total_duration == pytest.approx(expected_duration, rel=0.1)
+        assert cycles[0].start_time == t1
+        assert cycles[-1].end_time == t4
+        assert all(prev.end_time == nxt.start_time for prev, nxt in zip(cycles, cycles[1:]))
 
-    @pytest.mark.asyncio
     async def test_short_cycle_not_split(self, service_with_splitting, base_time):
         """Given cycle shorter than split_duration, does not split."""
         t0 = base_time
@@ -314,7 +344,6 @@ class TestExtractWithCycleSplitting:
 class TestExtractEdgeCases:
     """Test edge cases and boundary conditions."""
 
-    @pytest.mark.asyncio
     async def test_unfinished_cycle_at_end(self, service, base_time):
         """Given heating active at end of dataset, includes unfinished cycle."""
         t0 = base_time
@@ -344,7 +373,6 @@ class TestExtractEdgeCases:
         assert cycles[0].start_time == t1
         assert cycles[0].end_time == end_time  # Uses dataset end_time
 
-    @pytest.mark.asyncio
     async def test_too_short_cycle_rejected(self, service, base_time):
         """Given cycle shorter than min_cycle_duration, rejects it."""
         t0 = base_time
@@ -375,7 +403,6 @@ class TestExtractEdgeCases:
         # Should reject the short cycle (2 min < 5 min minimum)
         assert len(cycles) == 0
 
-    @pytest.mark.asyncio
     async def test_missing_temperature_data_falls_back_to_prior(self, service, base_time):
         """Given missing temperature at some timestamps, falls back to prior measurement."""
         t0 = base_time
@@ -422,7 +449,6 @@ class TestExtractEdgeCases:
         assert cycles[0].end_time == t4 + timedelta(minutes=5)  # Ends at t4
         assert cycles[0].end_temp == 19.2  # uses t2 temp fallback (19.2)        
 
-    @pytest.mark.asyncio
     async def test_empty_dataset_raises_error(self, service, base_time):
         """Given dataset without required keys, raises ValueError."""
         dataset = HistoricalDataSet(data={})
@@ -430,87 +456,33 @@ class TestExtractEdgeCases:
         with pytest.raises(ValueError, match="Missing critical historical data"):
             await service.extract_heating_cycles("my_device_id", dataset, base_time, base_time + timedelta(hours=1))
 
-    @pytest.mark.asyncio
-    async def test_cycle_split_duration_parameter_override(self, service, base_time):
+    async def test_cycle_split_duration_parameter_override(self, service, base_time, single_45min_cycle):
         """Given cycle_split_duration_minutes parameter, overrides instance setting."""
-        t0 = base_time
-        t1 = t0 + timedelta(minutes=5)
-        t2 = t0 + timedelta(minutes=45)  # 45-min cycle
-        t3 = t0 + timedelta(minutes=48)
-        
-        dataset = HistoricalDataSet(
-            data={
-                HistoricalDataKey.INDOOR_TEMP: [
-                    m(t0, 18.0),
-                    m(t1, 18.5),
-                    m(t2, 20.4),
-                    m(t3, 20.4),
-                ],
-                HistoricalDataKey.TARGET_TEMP: [
-                    m(t0, 20.0),
-                    m(t1, 20.0),
-                    m(t2, 20.0),
-                    m(t3, 20.0),
-                ],
-                HistoricalDataKey.HEATING_STATE: [
-                    m(t0, True, hvac_action="heating", hvac_mode="heat"),
-                    m(t1, True, hvac_action="heating", hvac_mode="heat"),
-                    m(t2, False, hvac_action="off", hvac_mode="heat"),
-                    m(t3, False, hvac_action="off", hvac_mode="heat"),
-                ],
-            }
-        )
+        dataset, end_time = single_45min_cycle
 
         # Service without splitting should return 1 cycle
-        cycles = await service.extract_heating_cycles("my_device_id", dataset, t0, t3)
+        cycles = await service.extract_heating_cycles("my_device_id", dataset, base_time, end_time)
         assert len(cycles) == 1
 
         # Same service with cycle_split_duration_minutes parameter should split the cycle
         cycles_split = await service.extract_heating_cycles(
-            "my_device_id", dataset, t0, t3, cycle_split_duration_minutes=15
+            "my_device_id", dataset, base_time, end_time, cycle_split_duration_minutes=15
         )
-        # 45-minute cycle split at 15-minute intervals = 3 sub-cycles + 1 remainder of 3 minutes
+        # 45-minute cycle split at 15-minute intervals = 3 sub-cycles, no remainder
         assert len(cycles_split) == 3
 
-    @pytest.mark.asyncio
-    async def test_explicit_none_split_parameter_uses_instance_default(self, service, base_time):
+    async def test_explicit_none_split_parameter_uses_instance_default(self, service, base_time, single_45min_cycle):
         """Given cycle_split_duration_minutes=None (legacy cache data), falls back to instance default without errors."""
         # This test ensures backward compatibility with legacy cache entries where split=None
-        t0 = base_time
-        t1 = t0 + timedelta(minutes=10)
-        t2 = t0 + timedelta(minutes=40)
-        t3 = t0 + timedelta(minutes=50)
-        
-        dataset = HistoricalDataSet(
-            data={
-                HistoricalDataKey.INDOOR_TEMP: [
-                    m(t0, 18.0),
-                    m(t1, 18.5),
-                    m(t2, 20.4),
-                    m(t3, 20.4),
-                ],
-                HistoricalDataKey.TARGET_TEMP: [
-                    m(t0, 20.0),
-                    m(t1, 20.0),
-                    m(t2, 20.0),
-                    m(t3, 20.0),
-                ],
-                HistoricalDataKey.HEATING_STATE: [
-                    m(t0, True, hvac_action="heating", hvac_mode="heat"),
-                    m(t1, True, hvac_action="heating", hvac_mode="heat"),
-                    m(t2, False, hvac_action="off", hvac_mode="heat"),
-                    m(t3, False, hvac_action="off", hvac_mode="heat"),
-                ],
-            }
-        )
+        dataset, end_time = single_45min_cycle
 
         # Service with instance default split=None, and explicitly passing None
         # Should not raise TypeError on None > 0 comparison
         cycles = await service.extract_heating_cycles(
-            "my_device_id", dataset, t0, t3, cycle_split_duration_minutes=None
+            "my_device_id", dataset, base_time, end_time, cycle_split_duration_minutes=None
         )
         
         # Should return 1 cycle (no splitting since instance default is None)
         assert len(cycles) == 1
-        assert cycles[0].start_time == t0
-        # Verify no TypeError was raised during extraction
\ No newline at end of file
+        assert cycles[0].start_time == base_time
+        # Verify no TypeError was raised during extraction
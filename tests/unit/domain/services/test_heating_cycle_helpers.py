@@ -1,13 +1,9 @@
 """Unit tests for HeatingCycleService helper methods extracted during refactoring."""
-import sys
+import functools
 from datetime import datetime, timedelta
-from pathlib import Path
+from types import MappingProxyType
 import pytest
 
-# Add domain to path WITHOUT loading infrastructure layer
-DOMAIN_PATH = Path(__file__).parent.parent.parent.parent.parent / "custom_components" / "intelligent_heating_pilot" / "domain"
-sys.path.insert(0, str(DOMAIN_PATH.parent))
-
 from domain.services.heating_cycle_service import HeatingCycleService
 from domain.value_objects.historical_data import (
     HistoricalDataKey,
@@ -16,21 +12,26 @@ from domain.value_objects.historical_data import (
 )
 
 
+_EMPTY_ATTRIBUTES = MappingProxyType({})
+
+
+# typed=True keeps m(t, True) and m(t, 1) distinct; sharing is safe as measurements are frozen
+@functools.lru_cache(maxsize=1024, typed=True)
 def m(timestamp: datetime, value: float | str | bool, device_id: str = "test.device") -> HistoricalMeasurement:
-    """Helper to create HistoricalMeasurement with empty attributes."""
-    return HistoricalMeasurement(timestamp, value, {}, device_id)
+    """Helper to create HistoricalMeasurement with empty (read-only) attributes."""
+    return HistoricalMeasurement(timestamp, value, _EMPTY_ATTRIBUTES, device_id)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def service():
-    """Create HeatingCycleService instance for testing."""
+    """Create HeatingCycleService instance for testing (stateless, shared by the module)."""
     return HeatingCycleService(
         temp_delta_threshold=0.5,
         cycle_split_duration_minutes=None,
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def base_time():
     """Base timestamp for tests."""
     return datetime(2024, 1, 1, 12, 0, 0)
@@ -266,6 +267,29 @@ class TestComputeTariffBreakdown:
         # (end_time value is excluded as segment is a <= t < b)
         assert details[0].heating_duration_minutes == pytest.approx(1400.0 / 60.0)
 
+    def test_with_runtime_sensor_sums_each_segment_separately(self, service, base_time):
+        """Given unsorted runtime snapshots and a price change, each segment sums only its own values."""
+        start_time = base_time
+        mid_time = base_time + timedelta(minutes=30)
+        end_time = base_time + timedelta(hours=1)
+        tariff_history = [m(start_time, 0.10), m(mid_time, 0.20)]
+        energy_history = [m(start_time, 10.0), m(end_time, 12.0)]
+        runtime_history = [
+            m(mid_time + timedelta(minutes=10), 300.0),
+            m(start_time, 600.0),
+            m(mid_time, 900.0),  # Belongs to the second segment [mid_time, end_time)
+            m(start_time + timedelta(minutes=10), "unavailable"),  # Ignored
+        ]
+
+        _, details = service._compute_tariff_breakdown(
+            tariff_history, energy_history, runtime_history,
+            start_time, end_time, fallback_energy_kwh=0.0
+        )
+
+        assert [d.heating_duration_minutes for d in details] == pytest.approx(
+            [600.0 / 60.0, 1200.0 / 60.0]
+        )
+
     def test_without_tariff_or_energy_returns_empty(self, service, base_time):
         """Given missing tariff or energy data, returns (0.0, [])."""
         start_time = base_time
@@ -291,37 +315,37 @@ class TestComputeTariffBreakdown:
 class TestValidateCriticalData:
     """Tests for _validate_critical_data helper."""
 
-    def test_with_all_required_keys_succeeds(self, service):
+    def test_with_all_required_keys_succeeds(self, service, base_time):
         """Given dataset with all critical keys, does not raise."""
         dataset = HistoricalDataSet(
             data={
-                HistoricalDataKey.INDOOR_TEMP: [m(datetime.now(), 20.0)],
-                HistoricalDataKey.TARGET_TEMP: [m(datetime.now(), 21.0)],
-                HistoricalDataKey.HEATING_STATE: [m(datetime.now(), "heat")],
+                HistoricalDataKey.INDOOR_TEMP: [m(base_time, 20.0)],
+                HistoricalDataKey.TARGET_TEMP: [m(base_time, 21.0)],
+                HistoricalDataKey.HEATING_STATE: [m(base_time, "heat")],
             }
         )
 
         # Should not raise
         service._validate_critical_data(dataset)
 
-    def test_with_missing_indoor_temp_raises(self, service):
+    def test_with_missing_indoor_temp_raises(self, service, base_time):
         """Given missing INDOOR_TEMP, raises ValueError."""
         dataset = HistoricalDataSet(
             data={
-                HistoricalDataKey.TARGET_TEMP: [m(datetime.now(), 21.0)],
-                HistoricalDataKey.HEATING_STATE: [m(datetime.now(), "heat")],
+                HistoricalDataKey.TARGET_TEMP: [m(base_time, 21.0)],
+                HistoricalDataKey.HEATING_STATE: [m(base_time, "heat")],
             }
         )
 
         with pytest.raises(ValueError, match="Missing critical historical data for key: indoor_temp"):
             service._validate_critical_data(dataset)
 
-    def test_with_missing_heating_state_raises(self, service):
+    def test_with_missing_heating_state_raises(self, service, base_time):
         """Given missing HEATING_STATE, raises ValueError."""
         dataset = HistoricalDataSet(
             data={
-                HistoricalDataKey.INDOOR_TEMP: [m(datetime.now(), 20.0)],
-                HistoricalDataKey.TARGET_TEMP: [m(datetime.now(), 21.0)],
+                HistoricalDataKey.INDOOR_TEMP: [m(base_time, 20.0)],
+                HistoricalDataKey.TARGET_TEMP: [m(base_time, 21.0)],
             }
         )
 
@@ -329,162 +353,167 @@ class TestValidateCriticalData:
             service._validate_critical_data(dataset)
 
 
-class TestGetTemperaturesAt:
-    """Tests for _get_temperatures_at helper."""
+class TestForwardFill:
+    """Tests for _forward_fill helper."""
 
-    def test_with_both_temps_available_returns_tuple(self, service, base_time):
-        """Given both temperatures available, returns (indoor, target)."""
-        dataset = HistoricalDataSet(
-            data={
-                HistoricalDataKey.INDOOR_TEMP: [
-                    m(base_time, 19.5)
-                ],
-                HistoricalDataKey.TARGET_TEMP: [
-                    m(base_time, 21.0)
-                ],
-            }
-        )
+    def test_matches_get_value_at_time_for_each_query(self, service, base_time):
+        """Given unsorted history, returns the value at or before each query time."""
+        history = [
+            m(base_time + timedelta(minutes=10), 19.0),
+            m(base_time, 18.0),
+            m(base_time + timedelta(minutes=20), "not_a_number"),
+        ]
+        query_times = [base_time + timedelta(minutes=offset) for offset in (-5, 0, 15, 20, 30)]
 
-        indoor, target = service._get_temperatures_at(dataset, base_time)
+        result = service._forward_fill(history, query_times, float)
 
-        assert indoor == 19.5
-        assert target == 21.0
+        assert result == [None, 18.0, 19.0, None, None]
+        assert result == [service._get_value_at_time(history, t, float) for t in query_times]
 
-    def test_with_missing_indoor_returns_none(self, service, base_time):
-        """Given missing indoor temp, returns (None, target)."""
-        dataset = HistoricalDataSet(
-            data={
-                HistoricalDataKey.INDOOR_TEMP: [],
-                HistoricalDataKey.TARGET_TEMP: [
-                    m(base_time, 21.0)
-                ],
-            }
-        )
+    def test_constant_series_returns_value_from_first_sample(self, service, base_time):
+        """Given an unchanging series, returns its value from the earliest sample onwards."""
+        history = [m(base_time + timedelta(minutes=10), 20.0), m(base_time, 20.0)]
+        query_times = [base_time - timedelta(minutes=1), base_time, base_time + timedelta(hours=1)]
+
+        result = service._forward_fill(history, query_times, float)
+
+        assert result == [None, 20.0, 20.0]
+        assert result == [service._get_value_at_time(history, t, float) for t in query_times]
 
-        indoor, target = service._get_temperatures_at(dataset, base_time)
+    def test_with_empty_history_returns_none_per_query(self, service, base_time):
+        """Given no measurements, returns None for every query time."""
+        result = service._forward_fill([], [base_time, base_time + timedelta(minutes=5)], float)
 
-        assert indoor is None
-        assert target == 21.0
+        assert result == [None, None]
+
+
+class TestValueLookup:
+    """Tests for _value_lookup helper."""
+
+    def test_matches_get_value_at_time(self, service, base_time):
+        """Given unsorted history, each lookup returns the value at or before that time."""
+        history = [
+            m(base_time + timedelta(minutes=20), 12.5),
+            m(base_time, 10.0),
+            m(base_time + timedelta(minutes=10), 11.0),
+        ]
+        lookup = service._value_lookup(history, float)
 
-    def test_with_missing_target_returns_none(self, service, base_time):
-        """Given missing target temp, returns (indoor, None)."""
+        for offset in (-1, 0, 5, 10, 15, 20, 60):
+            query_time = base_time + timedelta(minutes=offset)
+            assert lookup(query_time) == service._get_value_at_time(history, query_time, float)
+
+        assert lookup(base_time - timedelta(minutes=1)) is None
+        assert lookup(base_time + timedelta(minutes=15)) == 11.0
+
+
+class TestDetectCycleSpans:
+    """Tests for _detect_cycle_spans helper."""
+
+    def test_returns_unvalidated_spans_in_order(self, service, base_time):
+        """Given two heating periods, returns both spans, even one too short to be a cycle."""
+        times = [base_time + timedelta(minutes=offset) for offset in (0, 2, 4, 10, 40)]
         dataset = HistoricalDataSet(
             data={
                 HistoricalDataKey.INDOOR_TEMP: [
-                    m(base_time, 19.5)
+                    m(times[0], 18.0), m(times[1], 20.8), m(times[3], 18.0), m(times[4], 20.8),
+                ],
+                HistoricalDataKey.TARGET_TEMP: [m(times[0], 21.0)],
+                HistoricalDataKey.HEATING_STATE: [
+                    m(times[0], True), m(times[1], True), m(times[2], False),
+                    m(times[3], True), m(times[4], True),
                 ],
-                HistoricalDataKey.TARGET_TEMP: [],
             }
         )
 
-        indoor, target = service._get_temperatures_at(dataset, base_time)
+        spans = service._detect_cycle_spans(dataset, times[4] + timedelta(minutes=5))
 
-        assert indoor == 19.5
-        assert target is None
+        assert [(span.start_time, span.end_time) for span in spans] == [
+            (times[0], times[1]),  # 2 minutes: below min_cycle_duration, filtered later
+            (times[3], times[4]),
+        ]
+        assert spans[1].start_indoor_temp == 18.0
+        assert spans[1].end_indoor_temp == 20.8
+        assert spans[1].target_temp == 21.0
 
 
-class TestShouldStartCycle:
-    """Tests for _should_start_cycle helper."""
+class TestSplitIntoCycles:
+    """Tests for _split_into_cycles helper."""
 
-    def test_with_all_conditions_met_returns_true(self, service):
-        """Given mode_on=True, action_active=True, temp below target, returns True."""
-        result = service._should_start_cycle(
-            mode_on=True,
-            action_active=True,
-            indoor_temp=19.0,
-            target_temp=21.0,  # delta = 2.0 > 0.5 threshold
-        )
-
-        assert result is True
+    def test_splits_into_full_sub_cycles_and_remainder(self, service, base_time):
+        """Given a 100-minute cycle and 30-minute splits, returns 3 full sub-cycles and a 10-minute remainder."""
+        end_time = base_time + timedelta(minutes=100)
 
-    def test_with_mode_off_returns_false(self, service):
-        """Given mode_on=False (even with other conditions met), returns False."""
-        result = service._should_start_cycle(
-            mode_on=False,
-            action_active=True,
-            indoor_temp=19.0,
-            target_temp=21.0,
+        sub_cycles = service._split_into_cycles(
+            "test.device", base_time, end_time, 16.0, 21.0, 21.0, HistoricalDataSet(data={}), 30
         )
 
-        assert result is False
+        assert [c.start_time for c in sub_cycles] == [
+            base_time + timedelta(minutes=offset) for offset in (0, 30, 60, 90)
+        ]
+        assert sub_cycles[-1].end_time == end_time
+        # Temperatures interpolate linearly (0.05°C/min) and the remainder ends at the cycle end temp
+        assert [c.start_temp for c in sub_cycles] == pytest.approx([16.0, 17.5, 19.0, 20.5])
+        assert sub_cycles[-1].end_temp == 21.0
+
+    def test_exact_multiple_has_no_remainder(self, service, base_time):
+        """Given a 60-minute cycle and 30-minute splits, returns exactly 2 sub-cycles."""
+        end_time = base_time + timedelta(minutes=60)
 
-    def test_with_action_inactive_returns_false(self, service):
-        """Given action_active=False, returns False."""
-        result = service._should_start_cycle(
-            mode_on=True,
-            action_active=False,
-            indoor_temp=19.0,
-            target_temp=21.0,
+        sub_cycles = service._split_into_cycles(
+            "test.device", base_time, end_time, 18.0, 20.0, 21.0, HistoricalDataSet(data={}), 30
         )
 
-        assert result is False
+        assert len(sub_cycles) == 2
+        assert sub_cycles[-1].end_time == end_time
+        assert sub_cycles[-1].end_temp == pytest.approx(20.0)
 
-    def test_with_temp_within_threshold_returns_false(self, service):
-        """Given temperature within threshold of target, returns False."""
-        result = service._should_start_cycle(
-            mode_on=True,
-            action_active=True,
-            indoor_temp=20.8,
-            target_temp=21.0,  # delta = 0.2 < 0.5 threshold
-        )
 
-        assert result is False
+class TestShouldStartCycle:
+    """Tests for _should_start_cycle helper."""
 
-    def test_with_missing_temps_returns_false(self, service):
-        """Given None temperatures, returns False."""
+    @pytest.mark.parametrize(
+        ("mode_on", "action_active", "indoor_temp", "target_temp", "expected"),
+        [
+            pytest.param(True, True, 19.0, 21.0, True, id="all_conditions_met"),  # delta = 2.0 > 0.5
+            pytest.param(False, True, 19.0, 21.0, False, id="mode_off"),
+            pytest.param(True, False, 19.0, 21.0, False, id="action_inactive"),
+            pytest.param(True, True, 20.8, 21.0, False, id="temp_within_threshold"),  # delta = 0.2 < 0.5
+            pytest.param(True, True, None, 21.0, False, id="missing_temps"),
+        ],
+    )
+    def test_start_condition(self, service, mode_on, action_active, indoor_temp, target_temp, expected):
+        """Starts only with mode on, heating active and temperature below target minus threshold."""
         result = service._should_start_cycle(
-            mode_on=True,
-            action_active=True,
-            indoor_temp=None,
-            target_temp=21.0,
+            mode_on=mode_on,
+            action_active=action_active,
+            indoor_temp=indoor_temp,
+            target_temp=target_temp,
         )
 
-        assert result is False
+        assert result is expected
 
 
 class TestShouldEndCycle:
     """Tests for _should_end_cycle helper."""
 
-    def test_with_mode_off_returns_true_with_reason(self, service):
-        """Given mode_on=False, returns (True, 'mode_disabled')."""
-        ended, reason = service._should_end_cycle(
-            mode_on=False,
-            indoor_temp=19.0,
-            target_temp=21.0,
-        )
-
-        assert ended is True
-        assert reason == "mode_disabled"
-
-    def test_with_target_reached_returns_true(self, service):
-        """Given indoor >= target - threshold, returns (True, 'target_reached_or_within_threshold')."""
-        ended, reason = service._should_end_cycle(
-            mode_on=True,
-            indoor_temp=20.8,  # 21.0 - 0.5 = 20.5, so 20.8 >= 20.5
-            target_temp=21.0,
-        )
-
-        assert ended is True
-        assert reason == "target_reached_or_within_threshold"
-
-    def test_with_cycle_ongoing_returns_false(self, service):
-        """Given mode_on=True and temp below target, returns (False, '')."""
-        ended, reason = service._should_end_cycle(
-            mode_on=True,
-            indoor_temp=19.0,
-            target_temp=21.0,
-        )
-
-        assert ended is False
-        assert reason == ""
-
-    def test_with_missing_temps_continues(self, service):
-        """Given None temperatures (but mode_on), returns (False, '')."""
+    @pytest.mark.parametrize(
+        ("mode_on", "indoor_temp", "target_temp", "expected"),
+        [
+            pytest.param(False, 19.0, 21.0, (True, "mode_disabled"), id="mode_off"),
+            # 21.0 - 0.5 = 20.5, so 20.8 >= 20.5
+            pytest.param(True, 20.8, 21.0, (True, "target_reached_or_within_threshold"), id="target_reached"),
+            pytest.param(True, 19.0, 21.0, (False, ""), id="cycle_ongoing"),
+            pytest.param(True, None, 21.0, (False, ""), id="missing_temps_continues"),
+        ],
+    )
+    def test_end_condition(self, service, mode_on, indoor_temp, target_temp, expected):
+        """Ends on mode off or target reached, returning the reason."""
         ended, reason = service._should_end_cycle(
-            mode_on=True,
-            indoor_temp=None,
-            target_temp=21.0,
+            mode_on=mode_on,
+            indoor_temp=indoor_temp,
+            target_temp=target_temp,
         )
 
-        assert ended is False
-        assert reason == ""
+        assert (ended, reason) == expected
+        assert ended is expected[0]
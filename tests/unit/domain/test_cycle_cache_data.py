@@ -1,32 +1,24 @@
 """Tests for CycleCacheData value object."""
 from __future__ import annotations
 
-import os
-import sys
 from datetime import datetime, timezone, timedelta
 
 import pytest
 
-# Add custom_components to path
-sys.path.insert(
-    0,
-    os.path.join(
-        os.path.dirname(__file__),
-        "../../../custom_components/intelligent_heating_pilot",
-    ),
-)
-
 from domain.value_objects import CycleCacheData
 from .fixtures import create_test_heating_cycle, TEST_DEVICE_ID
 
 
-@pytest.fixture
+BASE_TIME = datetime(2025, 12, 18, 14, 0, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture(scope="module")
 def base_time() -> datetime:
     """Get base time for tests."""
-    return datetime(2025, 12, 18, 14, 0, 0, tzinfo=timezone.utc)
+    return BASE_TIME
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def device_id() -> str:
     """Get device ID for tests."""
     return TEST_DEVICE_ID
@@ -112,7 +104,7 @@ def test_zero_retention_days_raises_error(base_time: datetime, device_id: str) -
 
 def test_naive_timestamp_raises_error(device_id: str) -> None:
     """Test that timezone-naive timestamp raises ValueError."""
-    cycles = [create_test_heating_cycle(device_id, datetime(2025, 12, 18, 14, 0, 0, tzinfo=timezone.utc))]
+    cycles = [create_test_heating_cycle(device_id, BASE_TIME)]
     naive_time = datetime(2025, 12, 18, 14, 0, 0)  # No timezone
     
     with pytest.raises(ValueError, match="timezone-aware"):
@@ -199,6 +191,47 @@ def test_get_cycles_since_none_match(base_time: datetime, device_id: str) -> Non
     assert len(recent_cycles) == 0
 
 
+def test_get_cycles_since_includes_boundary_and_handles_unsorted(base_time: datetime, device_id: str) -> None:
+    """Test get_cycles_since keeps cycles starting exactly at the cutoff, in stored order."""
+    cycles = [
+        create_test_heating_cycle(device_id, base_time + timedelta(hours=4)),  # 18:00
+        create_test_heating_cycle(device_id, base_time),  # 14:00
+        create_test_heating_cycle(device_id, base_time + timedelta(hours=2)),  # 16:00
+    ]
+    cutoff = base_time + timedelta(hours=2)
+    
+    for stored in (cycles, sorted(cycles, key=lambda c: c.start_time)):
+        cache_data = CycleCacheData(
+            device_id=device_id,
+            cycles=tuple(stored),
+            last_search_time=base_time + timedelta(hours=6),
+            retention_days=30,
+        )
+        
+        recent_cycles = cache_data.get_cycles_since(cutoff)
+        
+        assert recent_cycles == [c for c in stored if c.start_time >= cutoff]
+        assert len(recent_cycles) == 2
+
+
+def test_mixed_naive_and_aware_start_times_still_construct(base_time: datetime, device_id: str) -> None:
+    """Test a cache whose start times cannot be ordered is built without an index."""
+    cycles = (
+        create_test_heating_cycle(device_id, base_time),
+        create_test_heating_cycle(device_id, base_time.replace(tzinfo=None) + timedelta(hours=2)),
+    )
+    
+    cache_data = CycleCacheData(
+        device_id=device_id,
+        cycles=cycles,
+        last_search_time=base_time + timedelta(hours=6),
+        retention_days=30,
+    )
+    
+    assert cache_data.cycle_count == 2
+    assert cache_data._sorted_start_times is None
+
+
 def test_get_cycles_within_retention(base_time: datetime, device_id: str) -> None:
     """Test get_cycles_within_retention filters correctly."""
     # Create cycles at different times
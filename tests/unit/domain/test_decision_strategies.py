@@ -1,8 +1,8 @@
 """Unit tests for decision strategies."""
 from __future__ import annotations
 
-from datetime import datetime, timedelta
-from unittest.mock import AsyncMock
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
 
 import pytest
 
@@ -16,227 +16,197 @@ from custom_components.intelligent_heating_pilot.domain.services.simple_decision
 from custom_components.intelligent_heating_pilot.domain.value_objects import (
     EnvironmentState,
     HeatingAction,
+    LHSCacheEntry,
     ScheduledTimeslot,
 )
 
+# Frozen "current" time shared by every test so decisions are reproducible.
+NOW = datetime(2025, 12, 18, 14, 0, 0, tzinfo=timezone.utc)
 
-@pytest.fixture
-def mock_scheduler_reader():
-    """Create a mock scheduler reader."""
-    return AsyncMock(spec=ISchedulerReader)
+# Baseline value objects; scenarios vary one field via dataclasses.replace.
+BASE_ENV = EnvironmentState(
+    indoor_temperature=18.0,
+    outdoor_temp=5.0,
+    indoor_humidity=50.0,
+    cloud_coverage=0.5,
+    timestamp=NOW,
+)
+BASE_SLOT = ScheduledTimeslot(
+    target_time=NOW + timedelta(hours=1),
+    target_temp=20.0,
+    timeslot_id="test_slot",
+)
+
+
+class StubSchedulerReader(ISchedulerReader):
+    """Scheduler reader stub returning a preset next timeslot (always enabled)."""
+
+    def __init__(self) -> None:
+        self.next_timeslot: ScheduledTimeslot | None = None
+
+    async def get_next_timeslot(self) -> ScheduledTimeslot | None:
+        return self.next_timeslot
+
+    async def is_scheduler_enabled(self, scheduler_entity_id: str) -> bool:
+        return True
+
+
+class StubModelStorage(IModelStorage):
+    """Model storage stub returning a preset learned heating slope.
+
+    The LHS cache is always empty and writes are ignored.
+    """
+
+    def __init__(self) -> None:
+        self.learned_heating_slope = 2.0  # 2°C/hour
+
+    async def get_learned_heating_slope(self) -> float:
+        return self.learned_heating_slope
+
+    async def clear_slope_history(self) -> None:
+        pass
+
+    async def get_cached_global_lhs(self) -> LHSCacheEntry | None:
+        return None
+
+    async def set_cached_global_lhs(self, lhs: float, updated_at: datetime) -> None:
+        pass
 
+    async def get_cached_contextual_lhs(self, hour: int) -> LHSCacheEntry | None:
+        return None
 
-@pytest.fixture
-def mock_model_storage():
-    """Create a mock model storage."""
-    storage = AsyncMock(spec=IModelStorage)
-    storage.get_learned_heating_slope.return_value = 2.0  # 2°C/hour
-    return storage
+    async def set_cached_contextual_lhs(self, hour: int, lhs: float, updated_at: datetime) -> None:
+        pass
 
 
-@pytest.fixture
-def simple_strategy(mock_scheduler_reader, mock_model_storage):
-    """Create a simple decision strategy with mocked dependencies."""
+@pytest.fixture(scope="module")
+def scheduler_reader():
+    """Create a scheduler reader stub (reset before each test)."""
+    return StubSchedulerReader()
+
+
+@pytest.fixture(scope="module")
+def model_storage():
+    """Create a model storage stub (reset before each test)."""
+    return StubModelStorage()
+
+
+@pytest.fixture(autouse=True)
+def reset_stubs(scheduler_reader, model_storage):
+    """Restore the stub defaults left changed by the previous test."""
+    scheduler_reader.next_timeslot = None
+    model_storage.learned_heating_slope = 2.0  # 2°C/hour
+
+
+@pytest.fixture(scope="module")
+def simple_strategy(scheduler_reader, model_storage):
+    """Create a simple decision strategy with stubbed dependencies.
+
+    The strategy keeps no per-decision state, so one instance serves the module.
+    """
     return SimpleDecisionStrategy(
-        scheduler_reader=mock_scheduler_reader,
-        model_storage=mock_model_storage,
+        scheduler_reader=scheduler_reader,
+        model_storage=model_storage,
     )
 
 
 class TestSimpleDecisionStrategy:
     """Test suite for SimpleDecisionStrategy."""
-    
-    async def test_no_action_when_no_timeslots(
-        self, 
-        simple_strategy, 
-        mock_scheduler_reader
-    ):
-        """Should return NO_ACTION when no scheduled timeslots exist."""
-        # GIVEN: No scheduled timeslots
-        mock_scheduler_reader.get_next_timeslot.return_value = None
-        
-        environment = EnvironmentState(
-            indoor_temperature=18.0,
-            outdoor_temp=5.0,
-            indoor_humidity=50.0,
-            cloud_coverage=0.5,
-            timestamp=datetime.now(),
-        )
-        
-        # WHEN: Deciding action
-        decision = await simple_strategy.decide_heating_action(environment)
-        
-        # THEN: Should not take action
-        assert decision.action == HeatingAction.NO_ACTION
-        assert "No scheduled timeslots" in decision.reason
-    
-    async def test_no_action_when_already_at_target(
-        self,
-        simple_strategy,
-        mock_scheduler_reader,
-    ):
-        """Should return NO_ACTION when already at target temperature."""
-        # GIVEN: Already at target temperature
-        target_time = datetime.now() + timedelta(hours=1)
-        mock_scheduler_reader.get_next_timeslot.return_value = ScheduledTimeslot(
-            target_time=target_time,
-            target_temp=20.0,
-            timeslot_id="test_slot",
-        )
-        
-        environment = EnvironmentState(
-            indoor_temperature=20.5,  # Already above target
-            outdoor_temp=5.0,
-            indoor_humidity=50.0,
-            cloud_coverage=0.5,
-            timestamp=datetime.now(),
-        )
-        
-        # WHEN: Deciding action
-        decision = await simple_strategy.decide_heating_action(environment)
-        
-        # THEN: Should not heat
-        assert decision.action == HeatingAction.NO_ACTION
-        assert "Already at target" in decision.reason
-    
-    async def test_start_heating_when_time_reached(
-        self,
-        simple_strategy,
-        mock_scheduler_reader,
-        mock_model_storage,
-    ):
-        """Should START_HEATING when anticipated start time is reached."""
-        # GIVEN: Current temp below target, start time reached
-        now = datetime.now()
-        target_time = now + timedelta(hours=2)
-        
-        mock_scheduler_reader.get_next_timeslot.return_value = ScheduledTimeslot(
-            target_time=target_time,
-            target_temp=20.0,
-            timeslot_id="test_slot",
-        )
-        
-        mock_model_storage.get_learned_heating_slope.return_value = 2.0  # 2°C/hour
-        
-        environment = EnvironmentState(
-            indoor_temperature=16.0,  # 4°C below target
-            outdoor_temp=5.0,
-            indoor_humidity=50.0,
-            cloud_coverage=0.5,
-            timestamp=now,
-        )
-        
-        # WHEN: Deciding action
-        decision = await simple_strategy.decide_heating_action(environment)
-        
-        # THEN: Should start heating
-        # With 4°C to gain at 2°C/hour = 2 hours needed
-        # Target in 2 hours = should start now
-        assert decision.action == HeatingAction.START_HEATING
-        assert decision.target_temp == 20.0
-    
-    async def test_wait_when_too_early(
+
+    @pytest.mark.parametrize(
+        ("environment", "timeslot", "slope", "expected_action", "expected_reason"),
+        [
+            pytest.param(BASE_ENV, None, 2.0, HeatingAction.NO_ACTION, "No scheduled timeslots", id="no_timeslots"),
+            pytest.param(
+                replace(BASE_ENV, indoor_temperature=20.5),
+                BASE_SLOT,
+                2.0,
+                HeatingAction.NO_ACTION,
+                "Already at target",
+                id="already_at_target",
+            ),
+            # 4°C to gain at 2°C/hour = 2 hours needed, target in 2 hours: start now
+            pytest.param(
+                replace(BASE_ENV, indoor_temperature=16.0),
+                replace(BASE_SLOT, target_time=NOW + timedelta(hours=2)),
+                2.0,
+                HeatingAction.START_HEATING,
+                None,
+                id="start_when_time_reached",
+            ),
+            # 4°C to gain at 2°C/hour = 2 hours needed, target in 5 hours: wait 3 more hours
+            pytest.param(
+                replace(BASE_ENV, indoor_temperature=16.0),
+                replace(BASE_SLOT, target_time=NOW + timedelta(hours=5)),
+                2.0,
+                HeatingAction.NO_ACTION,
+                "Wait until",
+                id="wait_when_too_early",
+            ),
+            # Same 4°C and 2 hours as above, but a learned 8°C/hour needs only 30 min: wait
+            pytest.param(
+                replace(BASE_ENV, indoor_temperature=16.0),
+                replace(BASE_SLOT, target_time=NOW + timedelta(hours=2)),
+                8.0,
+                HeatingAction.NO_ACTION,
+                "Wait until",
+                id="wait_with_faster_learned_slope",
+            ),
+        ],
+    )
+    async def test_decide_heating_action(
         self,
         simple_strategy,
-        mock_scheduler_reader,
-        mock_model_storage,
+        scheduler_reader,
+        model_storage,
+        environment,
+        timeslot,
+        slope,
+        expected_action,
+        expected_reason,
     ):
-        """Should wait when it's too early to start heating."""
-        # GIVEN: Current temp below target, but plenty of time
-        now = datetime.now()
-        target_time = now + timedelta(hours=5)  # 5 hours away
-        
-        mock_scheduler_reader.get_next_timeslot.return_value = ScheduledTimeslot(
-            target_time=target_time,
-            target_temp=20.0,
-            timeslot_id="test_slot",
-        )
-        
-        mock_model_storage.get_learned_heating_slope.return_value = 2.0  # 2°C/hour
-        
-        environment = EnvironmentState(
-            indoor_temperature=16.0,  # 4°C below target
-            outdoor_temp=5.0,
-            indoor_humidity=50.0,
-            cloud_coverage=0.5,
-            timestamp=now,
-        )
-        
+        """Should pick the action matching the schedule, temperature and learned slope."""
+        # GIVEN: The next timeslot and the learned slope
+        scheduler_reader.next_timeslot = timeslot
+        model_storage.learned_heating_slope = slope
+
         # WHEN: Deciding action
         decision = await simple_strategy.decide_heating_action(environment)
-        
-        # THEN: Should wait
-        # With 4°C to gain at 2°C/hour = 2 hours needed
-        # Target in 5 hours = wait 3 more hours
-        assert decision.action == HeatingAction.NO_ACTION
-        assert "Wait until" in decision.reason
-    
-    async def test_stop_heating_on_overshoot_risk(
-        self,
-        simple_strategy,
-        mock_scheduler_reader,
-    ):
-        """Should STOP_HEATING when overshoot risk is detected."""
-        # GIVEN: High heating slope with risk of overshooting
-        now = datetime.now()
-        target_time = now + timedelta(hours=1)
-        
-        mock_scheduler_reader.get_next_timeslot.return_value = ScheduledTimeslot(
-            target_time=target_time,
-            target_temp=20.0,
-            timeslot_id="test_slot",
-        )
-        
-        environment = EnvironmentState(
-            indoor_temperature=18.0,
-            outdoor_temp=5.0,
-            indoor_humidity=50.0,
-            cloud_coverage=0.5,
-            timestamp=now,
-        )
-        
-        # WHEN: Checking overshoot with high slope
-        # At 3°C/hour, in 1 hour: 18 + 3 = 21°C (> 20.5 threshold)
-        decision = await simple_strategy.check_overshoot_risk(
-            environment=environment,
-            current_slope=3.0,  # High slope
-        )
-        
-        # THEN: Should stop heating
-        assert decision.action == HeatingAction.STOP_HEATING
-        assert "Overshoot risk" in decision.reason
-    
-    async def test_no_stop_when_no_overshoot_risk(
+
+        # THEN: Should take the expected action
+        assert decision.action == expected_action
+        if expected_reason is not None:
+            assert expected_reason in decision.reason
+        if expected_action == HeatingAction.START_HEATING:
+            assert decision.target_temp == 20.0
+
+    @pytest.mark.parametrize(
+        ("current_slope", "expected_action", "expected_reason"),
+        [
+            # At 3°C/hour, in 1 hour: 18 + 3 = 21°C (> 20.5 threshold)
+            pytest.param(3.0, HeatingAction.STOP_HEATING, "Overshoot risk", id="stop_on_overshoot_risk"),
+            # At 1.5°C/hour, in 1 hour: 18 + 1.5 = 19.5°C (< 20.5 threshold)
+            pytest.param(1.5, HeatingAction.NO_ACTION, "No overshoot risk", id="continue_without_risk"),
+        ],
+    )
+    async def test_check_overshoot_risk(
         self,
         simple_strategy,
-        mock_scheduler_reader,
+        scheduler_reader,
+        current_slope,
+        expected_action,
+        expected_reason,
     ):
-        """Should continue heating when no overshoot risk."""
-        # GIVEN: Moderate heating slope, no overshoot risk
-        now = datetime.now()
-        target_time = now + timedelta(hours=1)
-        
-        mock_scheduler_reader.get_next_timeslot.return_value = ScheduledTimeslot(
-            target_time=target_time,
-            target_temp=20.0,
-            timeslot_id="test_slot",
-        )
-        
-        environment = EnvironmentState(
-            indoor_temperature=18.0,
-            outdoor_temp=5.0,
-            indoor_humidity=50.0,
-            cloud_coverage=0.5,
-            timestamp=now,
-        )
-        
-        # WHEN: Checking overshoot with moderate slope
-        # At 1.5°C/hour, in 1 hour: 18 + 1.5 = 19.5°C (< 20.5 threshold)
+        """Should stop heating only when the current slope overshoots the target."""
+        # GIVEN: Target 1 hour away, 2°C to gain
+        scheduler_reader.next_timeslot = BASE_SLOT
+
+        # WHEN: Checking overshoot
         decision = await simple_strategy.check_overshoot_risk(
-            environment=environment,
-            current_slope=1.5,  # Moderate slope
+            environment=BASE_ENV,
+            current_slope=current_slope,
         )
-        
-        # THEN: Should continue
-        assert decision.action == HeatingAction.NO_ACTION
-        assert "No overshoot risk" in decision.reason
+
+        # THEN: Should take the expected action
+        assert decision.action == expected_action
+        assert expected_reason in decision.reason
@@ -1,21 +1,10 @@
 """Unit tests for incremental cycle cache functionality."""
 from __future__ import annotations
 
-import os
-import sys
 from datetime import datetime, timedelta, timezone
 
 import pytest
 
-# Add custom_components to path
-sys.path.insert(
-    0,
-    os.path.join(
-        os.path.dirname(__file__),
-        "../../../custom_components/intelligent_heating_pilot",
-    ),
-)
-
 from .fixtures import create_test_heating_cycle, TEST_DEVICE_ID
 
 
@@ -31,7 +20,6 @@ def device_id() -> str:
     return TEST_DEVICE_ID
 
 
-@pytest.mark.asyncio
 async def test_incremental_append_logic(base_time: datetime, device_id: str) -> None:
     """Test the incremental append logic with cache."""
     from domain.value_objects import CycleCacheData
@@ -69,7 +57,6 @@ async def test_incremental_append_logic(base_time: datetime, device_id: str) ->
     assert updated_cache.cycle_count == 4
 
 
-@pytest.mark.asyncio
 async def test_deduplication_logic(base_time: datetime, device_id: str) -> None:
     """Test that duplicate cycles are filtered."""
     from domain.value_objects import CycleCacheData
@@ -96,7 +83,6 @@ async def test_deduplication_logic(base_time: datetime, device_id: str) -> None:
     assert new_cycle_key in existing_keys
 
 
-@pytest.mark.asyncio
 async def test_empty_period_handling(base_time: datetime, device_id: str) -> None:
     """Test that empty periods (no cycles) update last_search_time."""
     from domain.value_objects import CycleCacheData
@@ -126,7 +112,6 @@ async def test_empty_period_handling(base_time: datetime, device_id: str) -> Non
     assert updated_cache.cycle_count == 1
 
 
-@pytest.mark.asyncio
 async def test_retention_filtering(base_time: datetime, device_id: str) -> None:
     """Test filtering cycles by retention period."""
     from domain.value_objects import CycleCacheData
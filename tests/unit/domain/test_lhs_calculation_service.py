@@ -1,349 +1,205 @@
 """Tests for LHSCalculationService."""
-import unittest
-from datetime import datetime, timezone, timedelta
+from __future__ import annotations
 
-import sys
-import os
+from datetime import datetime, timezone, timedelta
 
-# Add custom_components to path
-sys.path.insert(
-    0,
-    os.path.join(
-        os.path.dirname(__file__),
-        "../../../custom_components/intelligent_heating_pilot",
-    ),
-)
+import pytest
 
 from domain.services import LHSCalculationService
 from domain.value_objects import HeatingCycle
 
+BASE_TIME = datetime(2025, 12, 18, 14, 0, 0, tzinfo=timezone.utc)
 
-class TestLHSCalculationService(unittest.TestCase):
-    """Tests for LHS calculation service."""
-    
-    def setUp(self):
-        """Set up test fixtures."""
-        self.service = LHSCalculationService()
-    
-    def _create_cycle(
-        self,
-        start_time: datetime,
-        duration_hours: float,
-        temp_increase: float,
-        device_id: str = "test_device"
-    ) -> HeatingCycle:
-        """Helper to create a heating cycle with specific slope."""
-        end_time = start_time + timedelta(hours=duration_hours)
-        start_temp = 18.0
-        end_temp = start_temp + temp_increase
-        target_temp = end_temp + 0.5  # Slightly above end temp
-        
-        return HeatingCycle(
+
+def _create_cycles(
+    rows: tuple[tuple[float, float, float], ...],
+    device_id: str = "test_device",
+) -> list[HeatingCycle]:
+    """Build heating cycles from ``(start_offset_h, duration_h, temp_increase)`` rows.
+
+    Offsets are relative to BASE_TIME; each cycle starts at 18°C, so its
+    slope is ``temp_increase / duration_h``.
+    """
+    start_temp = 18.0
+    return [
+        HeatingCycle(
             device_id=device_id,
-            start_time=start_time,
-            end_time=end_time,
-            target_temp=target_temp,
-            end_temp=end_temp,
+            start_time=BASE_TIME + timedelta(hours=start_offset_h),
+            end_time=BASE_TIME + timedelta(hours=start_offset_h + duration_h),
+            target_temp=start_temp + temp_increase + 0.5,  # Slightly above end temp
+            end_temp=start_temp + temp_increase,
             start_temp=start_temp,
-            tariff_details=None
+            tariff_details=None,
         )
-    
-    def test_calculate_global_lhs_empty_list(self):
+        for start_offset_h, duration_h, temp_increase in rows
+    ]
+
+
+# Cycles are frozen, so each table's cycles are built once at collection and
+# shared by every test that uses them.
+NIGHT_CYCLES = _create_cycles(((9, 2.0, 4.0),))  # 23:00-01:00, 2.0°C/h
+
+
+@pytest.fixture(scope="module")
+def service():
+    """Create an uncapped LHS calculation service (stateless, shared by the module)."""
+    return LHSCalculationService()
+
+
+class TestLHSCalculationService:
+    """Tests for LHS calculation service."""
+
+    def test_calculate_global_lhs_empty_list(self, service):
         """Test calculating global LHS with empty list."""
-        result = self.service.calculate_global_lhs([])
-        
         # Should return default
-        self.assertEqual(result, 2.0)
-    
-    def test_calculate_global_lhs_single_cycle(self):
-        """Test calculating global LHS with a single cycle."""
-        # Create a cycle with 2°C increase in 1 hour = 2°C/h slope
-        base_time = datetime(2025, 12, 18, 14, 0, 0, tzinfo=timezone.utc)
-        cycle = self._create_cycle(
-            start_time=base_time,
-            duration_hours=1.0,
-            temp_increase=2.0
-        )
-        
-        result = self.service.calculate_global_lhs([cycle])
-        
-        # Should return the cycle's slope
-        self.assertAlmostEqual(result, 2.0, places=2)
-    
-    def test_calculate_global_lhs_multiple_cycles(self):
-        """Test calculating global LHS with multiple cycles."""
-        base_time = datetime(2025, 12, 18, 14, 0, 0, tzinfo=timezone.utc)
-        
-        # Create cycles with different slopes: 2.0, 2.2, 2.4 °C/h
-        cycles = [
-            self._create_cycle(base_time, duration_hours=1.0, temp_increase=2.0),
-            self._create_cycle(base_time + timedelta(hours=2), duration_hours=1.0, temp_increase=2.2),
-            self._create_cycle(base_time + timedelta(hours=4), duration_hours=1.0, temp_increase=2.4),
-        ]
-        
-        result = self.service.calculate_global_lhs(cycles)
-        
-        # Average should be (2.0 + 2.2 + 2.4) / 3 = 2.2
-        self.assertAlmostEqual(result, 2.2, places=2)
-    
-    def test_calculate_global_lhs_with_varying_durations(self):
-        """Test that global LHS handles cycles of different durations correctly."""
-        base_time = datetime(2025, 12, 18, 14, 0, 0, tzinfo=timezone.utc)
-        
-        # Different durations but similar heating rates
-        cycles = [
-            self._create_cycle(base_time, duration_hours=0.5, temp_increase=1.0),  # 2.0°C/h
-            self._create_cycle(base_time + timedelta(hours=1), duration_hours=2.0, temp_increase=4.0),  # 2.0°C/h
-            self._create_cycle(base_time + timedelta(hours=4), duration_hours=1.0, temp_increase=2.0),  # 2.0°C/h
-        ]
-        
-        result = self.service.calculate_global_lhs(cycles)
-        
-        # All have 2.0°C/h slope, average should be 2.0
-        self.assertAlmostEqual(result, 2.0, places=2)
-    
-    def test_calculate_contextual_lhs_empty_list(self):
+        assert service.calculate_global_lhs([]) == 2.0
+
+    def test_calculate_contextual_lhs_empty_list(self, service):
         """Test calculating contextual LHS with empty list."""
-        result = self.service.calculate_contextual_lhs([], target_hour=15)
-        
         # Should return default
-        self.assertEqual(result, 2.0)
-    
-    def test_calculate_contextual_lhs_invalid_hour(self):
+        assert service.calculate_contextual_lhs([], target_hour=15) == 2.0
+
+    @pytest.mark.parametrize("target_hour", [25, -1])
+    def test_calculate_contextual_lhs_invalid_hour(self, service, target_hour):
         """Test calculating contextual LHS with invalid hour."""
-        with self.assertRaises(ValueError):
-            self.service.calculate_contextual_lhs([], target_hour=25)
-        
-        with self.assertRaises(ValueError):
-            self.service.calculate_contextual_lhs([], target_hour=-1)
-    
-    def test_calculate_contextual_lhs_active_cycle(self):
-        """Test contextual LHS includes cycles active at target hour."""
-        base_time = datetime(2025, 12, 18, 14, 0, 0, tzinfo=timezone.utc)
-        
-        # Cycle from 14:00 to 16:00 (active at 15:00)
-        cycle = self._create_cycle(
-            start_time=base_time,
-            duration_hours=2.0,
-            temp_increase=4.0  # 2.0°C/h
-        )
-        
-        result = self.service.calculate_contextual_lhs([cycle], target_hour=15)
-        
-        # Should include this cycle
-        self.assertAlmostEqual(result, 2.0, places=2)
-    
-    def test_calculate_contextual_lhs_excludes_inactive_cycle(self):
-        """Test contextual LHS excludes cycles not active at target hour."""
-        base_time = datetime(2025, 12, 18, 14, 0, 0, tzinfo=timezone.utc)
-        
-        # Cycle from 14:00 to 15:00 (NOT active at 16:00)
-        cycle1 = self._create_cycle(
-            start_time=base_time,
-            duration_hours=1.0,
-            temp_increase=1.0
-        )
+        with pytest.raises(ValueError):
+            service.calculate_contextual_lhs([], target_hour=target_hour)
+
+    @pytest.mark.parametrize(
+        ("max_heating_slope", "cycles", "expected"),
+        [
+            # 2°C increase in 1 hour = 2°C/h slope
+            pytest.param(None, _create_cycles(((0, 1.0, 2.0),)), 2.0, id="single_cycle"),
+            # (2.0 + 2.2 + 2.4) / 3 = 2.2
+            pytest.param(
+                None,
+                _create_cycles(((0, 1.0, 2.0), (2, 1.0, 2.2), (4, 1.0, 2.4))),
+                2.2,
+                id="multiple_cycles",
+            ),
+            # Different durations, all 2.0°C/h
+            pytest.param(
+                None,
+                _create_cycles(((0, 0.5, 1.0), (1, 2.0, 4.0), (4, 1.0, 2.0))),
+                2.0,
+                id="varying_durations",
+            ),
+            # (2.0 + 3.0 + 15.0) / 3 = 6.67, capped to 5.0
+            pytest.param(
+                5.0,
+                _create_cycles(((0, 1.0, 2.0), (2, 1.0, 3.0), (4, 1.0, 15.0))),
+                5.0,
+                id="max_slope_caps_result",
+            ),
+            # (2.0 + 15.0) / 2 = 8.5 (no cap)
+            pytest.param(
+                None,
+                _create_cycles(((0, 1.0, 2.0), (2, 1.0, 15.0))),
+                8.5,
+                id="max_slope_none_no_cap",
+            ),
+            # (2.0 + 3.0 + 4.0) / 3 = 3.0, below 10.0 so no cap applied
+            pytest.param(
+                10.0,
+                _create_cycles(((0, 1.0, 2.0), (2, 1.0, 3.0), (4, 1.0, 4.0))),
+                3.0,
+                id="max_slope_below_limit",
+            ),
+            # (4.0 + 5.0 + 6.0) / 3 = 5.0, equals max
+            pytest.param(
+                5.0,
+                _create_cycles(((0, 1.0, 4.0), (2, 1.0, 5.0), (4, 1.0, 6.0))),
+                5.0,
+                id="max_slope_at_limit",
+            ),
+            # (6.0 + 7.0) / 2 = 6.5, capped to 5.0
+            pytest.param(
+                5.0,
+                _create_cycles(((0, 1.0, 6.0), (2, 1.0, 7.0))),
+                5.0,
+                id="max_slope_above_limit",
+            ),
+        ],
+    )
+    def test_calculate_global_lhs(self, max_heating_slope, cycles, expected):
+        """Test global LHS averages cycle slopes and applies the max slope cap."""
+        service = LHSCalculationService(max_heating_slope=max_heating_slope)
 
-        # Cycle from 16:30 to 17:30 (NOT active at 16:00)
-        cycle2 = self._create_cycle(
-            start_time=base_time,
-            duration_hours=1.0,
-            temp_increase=2.0
-        )        
-        
-        result = self.service.calculate_contextual_lhs([cycle1, cycle2], target_hour=16)
-        
-        # Should not include this cycle, return default
-        self.assertEqual(result, 1.5)
-    
-    def test_calculate_contextual_lhs_filters_correctly(self):
-        """Test contextual LHS filters cycles by activity at target hour."""
-        base_time = datetime(2025, 12, 18, 14, 0, 0, tzinfo=timezone.utc)
-        
-        cycles = [
-            # Cycle 1: 12:00-13:00 (NOT active at 15:00)
-            self._create_cycle(base_time - timedelta(hours=2), duration_hours=1.0, temp_increase=1.0),  # 1.0°C/h
-            
-            # Cycle 2: 14:00-16:00 (ACTIVE at 15:00)
-            self._create_cycle(base_time, duration_hours=2.0, temp_increase=4.0),  # 2.0°C/h
-            
-            # Cycle 3: 15:30-17:00 (ACTIVE at 15:00 - starts before 16:00)
-            self._create_cycle(base_time + timedelta(hours=1.5), duration_hours=1.5, temp_increase=3.0),  # 2.0°C/h
-            
-            # Cycle 4: 17:00-18:00 (NOT active at 15:00)
-            self._create_cycle(base_time + timedelta(hours=3), duration_hours=1.0, temp_increase=3.0),  # 3.0°C/h
-        ]
-        
-        result = self.service.calculate_contextual_lhs(cycles, target_hour=15)
-        
-        # Should only average cycles 2 and 3 (both 2.0°C/h)
-        # Average = (2.0 + 2.0) / 2 = 2.0
-        self.assertAlmostEqual(result, 2.0, places=2)
-    
-    def test_calculate_contextual_lhs_exact_hour_boundary(self):
-        """Test contextual LHS at exact cycle boundaries."""
-        base_time = datetime(2025, 12, 18, 15, 0, 0, tzinfo=timezone.utc)
-        
-        # Cycle starts exactly at target hour (15:00-16:00)
-        cycle_at_hour = self._create_cycle(base_time, duration_hours=1.0, temp_increase=2.0)
-        
-        # Cycle ends exactly at target hour (14:00-15:00)
-        cycle_before_hour = self._create_cycle(
-            base_time - timedelta(hours=1),
-            duration_hours=1.0,
-            temp_increase=3.0
-        )
-        
-        cycles = [cycle_at_hour, cycle_before_hour]
-        result = self.service.calculate_contextual_lhs(cycles, target_hour=15)
-        
-        # Cycle ending at 15:00 is NOT active at 15:00 (exclusive end)
-        # Only cycle starting at 15:00 should be included
-        self.assertAlmostEqual(result, 2.0, places=2)
-    
-    def test_calculate_contextual_lhs_crosses_midnight(self):
-        """Test contextual LHS with cycles crossing midnight."""
-        # Cycle from 23:00 to 01:00 (crosses midnight)
-        night_cycle = self._create_cycle(
-            start_time=datetime(2025, 12, 18, 23, 0, 0, tzinfo=timezone.utc),
-            duration_hours=2.0,
-            temp_increase=4.0  # 2.0°C/h
-        )
-        
-        # Should be active at 00:00 (midnight)
-        result = self.service.calculate_contextual_lhs([night_cycle], target_hour=0)
-        self.assertAlmostEqual(result, 2.0, places=2)
-        
-        # Should also be active at 23:00
-        result = self.service.calculate_contextual_lhs([night_cycle], target_hour=23)
-        self.assertAlmostEqual(result, 2.0, places=2)
-    
-    def test_calculate_contextual_lhs_multiple_active_different_slopes(self):
-        """Test contextual LHS averages multiple cycles with different slopes."""
-        base_time = datetime(2025, 12, 18, 14, 0, 0, tzinfo=timezone.utc)
-        
-        cycles = [
-            # All active at 15:00 but with different slopes
-            self._create_cycle(base_time, duration_hours=2.0, temp_increase=2.0),     # 1.0°C/h
-            self._create_cycle(base_time, duration_hours=2.0, temp_increase=4.0),     # 2.0°C/h
-            self._create_cycle(base_time, duration_hours=2.0, temp_increase=6.0),     # 3.0°C/h
-        ]
-        
-        result = self.service.calculate_contextual_lhs(cycles, target_hour=15)
-        
-        # Average = (1.0 + 2.0 + 3.0) / 3 = 2.0
-        self.assertAlmostEqual(result, 2.0, places=2)
-    
-    def test_max_heating_slope_caps_final_result_global(self):
-        """Test that max_heating_slope caps the final calculated result in global LHS calculation."""
-        # Create service with max_heating_slope of 5.0
-        service = LHSCalculationService(max_heating_slope=5.0)
-        
-        base_time = datetime(2025, 12, 18, 14, 0, 0, tzinfo=timezone.utc)
-        
-        cycles = [
-            self._create_cycle(base_time, duration_hours=1.0, temp_increase=2.0),      # 2.0°C/h
-            self._create_cycle(base_time + timedelta(hours=2), duration_hours=1.0, temp_increase=3.0),  # 3.0°C/h
-            self._create_cycle(base_time + timedelta(hours=4), duration_hours=1.0, temp_increase=15.0), # 15.0°C/h
-        ]
-        
         result = service.calculate_global_lhs(cycles)
-        
-        # Average is (2.0 + 3.0 + 15.0) / 3 = 6.67, but should be capped to 5.0
-        self.assertAlmostEqual(result, 5.0, places=2)
-    
-    def test_max_heating_slope_caps_final_result_contextual(self):
-        """Test that max_heating_slope caps the final calculated result in contextual LHS calculation."""
-        # Create service with max_heating_slope of 5.0
-        service = LHSCalculationService(max_heating_slope=5.0)
-        
-        base_time = datetime(2025, 12, 18, 14, 0, 0, tzinfo=timezone.utc)
-        
-        cycles = [
-            # All active at 15:00
-            self._create_cycle(base_time, duration_hours=2.0, temp_increase=4.0),     # 2.0°C/h
-            self._create_cycle(base_time, duration_hours=2.0, temp_increase=6.0),     # 3.0°C/h
-            self._create_cycle(base_time, duration_hours=2.0, temp_increase=30.0),    # 15.0°C/h
-        ]
-        
-        result = service.calculate_contextual_lhs(cycles, target_hour=15)
-        
-        # Average is (2.0 + 3.0 + 15.0) / 3 = 6.67, but should be capped to 5.0
-        self.assertAlmostEqual(result, 5.0, places=2)
-    
+
+        assert result == pytest.approx(expected, abs=5e-3)
+
+    @pytest.mark.parametrize(
+        ("max_heating_slope", "cycles", "target_hour", "expected"),
+        [
+            # 14:00-16:00 is active at 15:00
+            pytest.param(None, _create_cycles(((0, 2.0, 4.0),)), 15, 2.0, id="active_cycle"),
+            # Both 14:00-15:00, neither active at 16:00: falls back to (1.0 + 2.0) / 2
+            pytest.param(
+                None,
+                _create_cycles(((0, 1.0, 1.0), (0, 1.0, 2.0))),
+                16,
+                1.5,
+                id="excludes_inactive_cycles",
+            ),
+            # Only 14:00-16:00 and 15:30-17:00 are active at 15:00, both 2.0°C/h
+            pytest.param(
+                None,
+                _create_cycles(((-2, 1.0, 1.0), (0, 2.0, 4.0), (1.5, 1.5, 3.0), (3, 1.0, 3.0))),
+                15,
+                2.0,
+                id="filters_by_activity",
+            ),
+            # 14:00-15:00 ends at 15:00 (exclusive end); only 15:00-16:00 is included
+            pytest.param(
+                None,
+                _create_cycles(((1, 1.0, 2.0), (0, 1.0, 3.0))),
+                15,
+                2.0,
+                id="exact_hour_boundary",
+            ),
+            # 23:00-01:00 crosses midnight: active at 00:00 and at 23:00
+            pytest.param(None, NIGHT_CYCLES, 0, 2.0, id="crosses_midnight_at_0"),
+            pytest.param(None, NIGHT_CYCLES, 23, 2.0, id="crosses_midnight_at_23"),
+            # Night cycle active at 00:00 is used alone, not the global (2.0 + 1.0) / 2 fallback
+            pytest.param(
+                None,
+                NIGHT_CYCLES + _create_cycles(((0, 1.0, 1.0),)),
+                0,
+                2.0,
+                id="crosses_midnight_not_global_fallback",
+            ),
+            # All active at 15:00: (1.0 + 2.0 + 3.0) / 3 = 2.0
+            pytest.param(
+                None,
+                _create_cycles(((0, 2.0, 2.0), (0, 2.0, 4.0), (0, 2.0, 6.0))),
+                15,
+                2.0,
+                id="different_slopes",
+            ),
+            # (2.0 + 3.0 + 15.0) / 3 = 6.67, capped to 5.0
+            pytest.param(
+                5.0,
+                _create_cycles(((0, 2.0, 4.0), (0, 2.0, 6.0), (0, 2.0, 30.0))),
+                15,
+                5.0,
+                id="max_slope_caps_result",
+            ),
+        ],
+    )
+    def test_calculate_contextual_lhs(self, max_heating_slope, cycles, target_hour, expected):
+        """Test contextual LHS averages only cycles active at the target hour."""
+        service = LHSCalculationService(max_heating_slope=max_heating_slope)
+
+        result = service.calculate_contextual_lhs(cycles, target_hour=target_hour)
+
+        assert result == pytest.approx(expected, abs=5e-3)
+
     def test_max_heating_slope_caps_final_result_simple_average(self):
         """Test that max_heating_slope caps the final calculated result in calculate_simple_average."""
-        # Create service with max_heating_slope of 5.0
-        service = LHSCalculationService(max_heating_slope=5.0)
-        
-        slope_values = [2.0, 3.0, 15.0, 20.0]
-        
-        result = service.calculate_simple_average(slope_values)
-        
-        # Average is (2.0 + 3.0 + 15.0 + 20.0) / 4 = 10.0, but should be capped to 5.0
-        self.assertAlmostEqual(result, 5.0, places=2)
-    
-    def test_max_heating_slope_none_no_cap(self):
-        """Test that when max_heating_slope is None, no capping is applied."""
-        service = LHSCalculationService(max_heating_slope=None)
-        
-        base_time = datetime(2025, 12, 18, 14, 0, 0, tzinfo=timezone.utc)
-        
-        cycles = [
-            self._create_cycle(base_time, duration_hours=1.0, temp_increase=2.0),      # 2.0°C/h
-            self._create_cycle(base_time + timedelta(hours=2), duration_hours=1.0, temp_increase=15.0),  # 15.0°C/h
-        ]
-        
-        result = service.calculate_global_lhs(cycles)
-        
-        # Average should be (2.0 + 15.0) / 2 = 8.5 (no cap)
-        self.assertAlmostEqual(result, 8.5, places=2)
-    
-    def test_max_heating_slope_no_cap_when_below_limit(self):
-        """Test that final result below max_heating_slope is not affected."""
-        service = LHSCalculationService(max_heating_slope=10.0)
-        
-        base_time = datetime(2025, 12, 18, 14, 0, 0, tzinfo=timezone.utc)
-        
-        cycles = [
-            self._create_cycle(base_time, duration_hours=1.0, temp_increase=2.0),      # 2.0°C/h
-            self._create_cycle(base_time + timedelta(hours=2), duration_hours=1.0, temp_increase=3.0),  # 3.0°C/h
-            self._create_cycle(base_time + timedelta(hours=4), duration_hours=1.0, temp_increase=4.0),  # 4.0°C/h
-        ]
-        
-        result = service.calculate_global_lhs(cycles)
-        
-        # Average is (2.0 + 3.0 + 4.0) / 3 = 3.0, which is below 10.0, so no cap applied
-        self.assertAlmostEqual(result, 3.0, places=2)
-    
-    def test_max_heating_slope_caps_when_above_limit(self):
-        """Test that final result above max_heating_slope is capped."""
         service = LHSCalculationService(max_heating_slope=5.0)
-        
-        base_time = datetime(2025, 12, 18, 14, 0, 0, tzinfo=timezone.utc)
-        
-        cycles = [
-            self._create_cycle(base_time, duration_hours=1.0, temp_increase=4.0),      # 4.0°C/h
-            self._create_cycle(base_time + timedelta(hours=2), duration_hours=1.0, temp_increase=5.0),  # 5.0°C/h
-            self._create_cycle(base_time + timedelta(hours=4), duration_hours=1.0, temp_increase=6.0),  # 6.0°C/h
-        ]
-        
-        result = service.calculate_global_lhs(cycles)
-        
-        # Average is (4.0 + 5.0 + 6.0) / 3 = 5.0, which equals max, so result is 5.0
-        self.assertAlmostEqual(result, 5.0, places=2)
-        
-        # Test with higher average
-        cycles2 = [
-            self._create_cycle(base_time, duration_hours=1.0, temp_increase=6.0),      # 6.0°C/h
-            self._create_cycle(base_time + timedelta(hours=2), duration_hours=1.0, temp_increase=7.0),  # 7.0°C/h
-        ]
-        
-        result2 = service.calculate_global_lhs(cycles2)
-        
-        # Average is (6.0 + 7.0) / 2 = 6.5, but should be capped to 5.0
-        self.assertAlmostEqual(result2, 5.0, places=2)
 
+        result = service.calculate_simple_average([2.0, 3.0, 15.0, 20.0])
 
-if __name__ == "__main__":
-    unittest.main()
+        # Average is (2.0 + 3.0 + 15.0 + 20.0) / 4 = 10.0, but should be capped to 5.0
+        assert result == pytest.approx(5.0, abs=5e-3)
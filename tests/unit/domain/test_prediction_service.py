@@ -1,25 +1,18 @@
 """Tests for prediction service."""
-import unittest
 from datetime import timedelta
 
-import sys
-import os
+import pytest
 
-# Add custom_components to path
-sys.path.insert(
-    0,
-    os.path.join(
-        os.path.dirname(__file__),
-        "../../../custom_components/intelligent_heating_pilot",
-    ),
+from custom_components.intelligent_heating_pilot.domain.services import PredictionService
+from custom_components.intelligent_heating_pilot.domain.constants import (
+    DEFAULT_ANTICIPATION_BUFFER,
+    MIN_ANTICIPATION_TIME,
+    MAX_ANTICIPATION_TIME,
+    OUTDOOR_TEMP_FACTOR,
+    OUTDOOR_TEMP_REFERENCE,
 )
 
-from domain.services import PredictionService
-from domain.constants import MIN_ANTICIPATION_TIME, MAX_ANTICIPATION_TIME
-
-# Import fixtures
-sys.path.insert(0, os.path.dirname(__file__))
-from fixtures import (
+from .fixtures import (
     get_test_datetime,
     get_future_datetime,
     TEST_CURRENT_TEMP,
@@ -30,160 +23,207 @@ from fixtures import (
 )
 
 
-class TestPredictionService(unittest.TestCase):
-    """Tests for PredictionService."""
-
-    def setUp(self):
-        """Set up test fixtures."""
-        self.service = PredictionService()
-
-    def test_predict_heating_time_basic(self):
-        """Test basic heating time prediction."""
-        target_time = get_future_datetime(2)
-        
-        result = self.service.predict_heating_time(
-            current_temp=TEST_CURRENT_TEMP,
-            target_temp=TEST_TARGET_TEMP,
-            learned_slope=TEST_LEARNED_SLOPE,
-            target_time=target_time,
-            outdoor_temp=TEST_OUTDOOR_TEMP,
-            humidity=TEST_HUMIDITY,
-        )
-        
-        # Should have valid result
-        self.assertIsNotNone(result)
-        self.assertGreater(result.estimated_duration_minutes, 0)
-        self.assertGreater(result.confidence_level, 0)
-        self.assertEqual(result.learned_heating_slope, TEST_LEARNED_SLOPE)
-        
-        # Anticipated start should be before target
-        self.assertLess(result.anticipated_start_time, target_time)
-
-    def test_predict_no_heating_needed(self):
-        """Test prediction when already at target temperature."""
-        target_time = get_future_datetime(2)
-        
-        result = self.service.predict_heating_time(
-            current_temp=21.0,
-            target_temp=21.0,
-            learned_slope=TEST_LEARNED_SLOPE,
-            target_time=target_time,
-        )
-        
-        # Should return zero duration and target_time as anticipated_start
-        self.assertEqual(result.estimated_duration_minutes, 0.0)
-        self.assertEqual(result.confidence_level, 1.0)
-        self.assertEqual(result.anticipated_start_time, target_time)
-
-    def test_high_humidity_increases_duration(self):
-        """Test that high humidity increases heating duration."""
-        target_time = get_future_datetime(2)
-        
-        # Normal humidity
-        result_normal = self.service.predict_heating_time(
-            current_temp=TEST_CURRENT_TEMP,
-            target_temp=TEST_TARGET_TEMP,
-            learned_slope=TEST_LEARNED_SLOPE,
-            target_time=target_time,
-            humidity=50.0,
-        )
-        
-        # High humidity
-        result_high = self.service.predict_heating_time(
-            current_temp=TEST_CURRENT_TEMP,
-            target_temp=TEST_TARGET_TEMP,
-            learned_slope=TEST_LEARNED_SLOPE,
-            target_time=target_time,
-            humidity=75.0,
-        )
-        
-        # High humidity should increase duration
-        self.assertGreater(
-            result_high.estimated_duration_minutes,
-            result_normal.estimated_duration_minutes
-        )
-
-    def test_cloud_coverage_increases_duration(self):
-        """Test that high cloud coverage increases heating duration."""
-        target_time = get_future_datetime(2)
-        
-        # Clear sky
-        result_clear = self.service.predict_heating_time(
-            current_temp=TEST_CURRENT_TEMP,
-            target_temp=TEST_TARGET_TEMP,
-            learned_slope=TEST_LEARNED_SLOPE,
-            target_time=target_time,
-            cloud_coverage=10.0,
-        )
-        
-        # Overcast
-        result_cloudy = self.service.predict_heating_time(
-            current_temp=TEST_CURRENT_TEMP,
-            target_temp=TEST_TARGET_TEMP,
-            learned_slope=TEST_LEARNED_SLOPE,
-            target_time=target_time,
-            cloud_coverage=90.0,
-        )
-        
-        # Clouds should increase duration
-        self.assertGreater(
-            result_cloudy.estimated_duration_minutes,
-            result_clear.estimated_duration_minutes
-        )
-
-    def test_respects_min_anticipation_time(self):
-        """Test that minimum anticipation time is enforced."""
-        target_time = get_future_datetime(2)
-        
-        # Very small temperature difference with high slope
-        result = self.service.predict_heating_time(
-            current_temp=20.9,
-            target_temp=21.0,
-            learned_slope=10.0,
-            target_time=target_time,
-        )
-        
-        # Should respect minimum
-        self.assertGreaterEqual(
-            result.estimated_duration_minutes,
-            MIN_ANTICIPATION_TIME
-        )
-
-    def test_respects_max_anticipation_time(self):
-        """Test that maximum anticipation time is enforced."""
-        target_time = get_future_datetime(5)
-        
-        # Large temperature difference with slow slope
-        result = self.service.predict_heating_time(
-            current_temp=10.0,
-            target_temp=25.0,
-            learned_slope=0.5,
-            target_time=target_time,
-            humidity=80.0,
-        )
-        
-        # Should respect maximum
-        self.assertLessEqual(
-            result.estimated_duration_minutes,
-            MAX_ANTICIPATION_TIME
-        )
-
-    def test_handles_invalid_slope(self):
-        """Test handling of invalid (zero or negative) slope."""
-        target_time = get_future_datetime(2)
-        
-        # Zero slope should return zero confidence
-        result = self.service.predict_heating_time(
-            current_temp=TEST_CURRENT_TEMP,
-            target_temp=TEST_TARGET_TEMP,
-            learned_slope=0.0,
-            target_time=target_time,
-        )
-        
-        # Should return target_time and zero confidence
-        self.assertEqual(result.anticipated_start_time, target_time)
-        self.assertEqual(result.confidence_level, 0.0)
-
-
-if __name__ == "__main__":
-    unittest.main()
+@pytest.fixture(scope="module")
+def prediction_service() -> PredictionService:
+    """Stateless prediction service shared by the whole module."""
+    return PredictionService()
+
+
+def test_predict_heating_time_basic(prediction_service: PredictionService) -> None:
+    """Test basic heating time prediction."""
+    target_time = get_future_datetime(2)
+    
+    result = prediction_service.predict_heating_time(
+        current_temp=TEST_CURRENT_TEMP,
+        target_temp=TEST_TARGET_TEMP,
+        learned_slope=TEST_LEARNED_SLOPE,
+        target_time=target_time,
+        outdoor_temp=TEST_OUTDOOR_TEMP,
+        humidity=TEST_HUMIDITY,
+    )
+    
+    # Should have valid result
+    assert result is not None
+    assert result.estimated_duration_minutes > 0
+    assert result.confidence_level > 0
+    assert result.learned_heating_slope == TEST_LEARNED_SLOPE
+    
+    # Anticipated start should be before target
+    assert result.anticipated_start_time < target_time
+
+
+def test_predict_no_heating_needed(prediction_service: PredictionService) -> None:
+    """Test prediction when already at target temperature."""
+    target_time = get_future_datetime(2)
+    
+    result = prediction_service.predict_heating_time(
+        current_temp=21.0,
+        target_temp=21.0,
+        learned_slope=TEST_LEARNED_SLOPE,
+        target_time=target_time,
+    )
+    
+    # Should return zero duration and target_time as anticipated_start
+    assert result.estimated_duration_minutes == 0.0
+    assert result.confidence_level == 1.0
+    assert result.anticipated_start_time == target_time
+
+
+def test_high_humidity_increases_duration(prediction_service: PredictionService) -> None:
+    """Test that high humidity increases heating duration."""
+    target_time = get_future_datetime(2)
+    
+    # Normal humidity
+    result_normal = prediction_service.predict_heating_time(
+        current_temp=TEST_CURRENT_TEMP,
+        target_temp=TEST_TARGET_TEMP,
+        learned_slope=TEST_LEARNED_SLOPE,
+        target_time=target_time,
+        humidity=50.0,
+    )
+    
+    # High humidity
+    result_high = prediction_service.predict_heating_time(
+        current_temp=TEST_CURRENT_TEMP,
+        target_temp=TEST_TARGET_TEMP,
+        learned_slope=TEST_LEARNED_SLOPE,
+        target_time=target_time,
+        humidity=75.0,
+    )
+    
+    # High humidity should increase duration
+    assert result_high.estimated_duration_minutes > result_normal.estimated_duration_minutes
+
+
+def test_cloud_coverage_increases_duration(prediction_service: PredictionService) -> None:
+    """Test that high cloud coverage increases heating duration."""
+    target_time = get_future_datetime(2)
+    
+    # Clear sky
+    result_clear = prediction_service.predict_heating_time(
+        current_temp=TEST_CURRENT_TEMP,
+        target_temp=TEST_TARGET_TEMP,
+        learned_slope=TEST_LEARNED_SLOPE,
+        target_time=target_time,
+        cloud_coverage=10.0,
+    )
+    
+    # Overcast
+    result_cloudy = prediction_service.predict_heating_time(
+        current_temp=TEST_CURRENT_TEMP,
+        target_temp=TEST_TARGET_TEMP,
+        learned_slope=TEST_LEARNED_SLOPE,
+        target_time=target_time,
+        cloud_coverage=90.0,
+    )
+    
+    # Clouds should increase duration
+    assert result_cloudy.estimated_duration_minutes > result_clear.estimated_duration_minutes
+
+
+def test_respects_min_anticipation_time(prediction_service: PredictionService) -> None:
+    """Test that minimum anticipation time is enforced."""
+    target_time = get_future_datetime(2)
+    
+    # Very small temperature difference with high slope
+    result = prediction_service.predict_heating_time(
+        current_temp=20.9,
+        target_temp=21.0,
+        learned_slope=10.0,
+        target_time=target_time,
+    )
+    
+    # Should respect minimum
+    assert result.estimated_duration_minutes >= MIN_ANTICIPATION_TIME
+
+
+def test_respects_max_anticipation_time(prediction_service: PredictionService) -> None:
+    """Test that maximum anticipation time is enforced."""
+    target_time = get_future_datetime(5)
+    
+    # Large temperature difference with slow slope
+    result = prediction_service.predict_heating_time(
+        current_temp=10.0,
+        target_temp=25.0,
+        learned_slope=0.5,
+        target_time=target_time,
+        humidity=80.0,
+    )
+    
+    # Should respect maximum
+    assert result.estimated_duration_minutes <= MAX_ANTICIPATION_TIME
+
+
+def test_handles_invalid_slope(prediction_service: PredictionService) -> None:
+    """Test handling of invalid (zero or negative) slope."""
+    target_time = get_future_datetime(2)
+    
+    # Zero slope should return zero confidence
+    result = prediction_service.predict_heating_time(
+        current_temp=TEST_CURRENT_TEMP,
+        target_temp=TEST_TARGET_TEMP,
+        learned_slope=0.0,
+        target_time=target_time,
+    )
+    
+    # Should return target_time and zero confidence
+    assert result.anticipated_start_time == target_time
+    assert result.confidence_level == 0.0
+
+
+def _expected_duration(current: float, target: float, outdoor: float, slope: float) -> float:
+    """Reference anticipation (minutes) with outdoor correction only."""
+    outdoor_factor = max(0.5, 1.0 + (OUTDOOR_TEMP_REFERENCE - outdoor) * OUTDOOR_TEMP_FACTOR)
+    minutes = (target - current) / slope * 60.0 * outdoor_factor + DEFAULT_ANTICIPATION_BUFFER
+    return max(MIN_ANTICIPATION_TIME, min(MAX_ANTICIPATION_TIME, minutes))
+
+
+@pytest.mark.parametrize("outdoor_temp", [-15.0, -10.0, 0.0, 10.0, 20.0, 30.0])
+@pytest.mark.parametrize(
+    ("current_temp", "target_temp"),
+    [(10.0, 18.0), (18.0, 21.0), (20.5, 21.0), (16.0, 24.0)],
+)
+def test_duration_matches_reference_over_condition_grid(
+    prediction_service: PredictionService,
+    current_temp: float,
+    target_temp: float,
+    outdoor_temp: float,
+) -> None:
+    """Test duration matches the reference formula over a grid of conditions."""
+    result = prediction_service.predict_heating_time(
+        current_temp=current_temp,
+        target_temp=target_temp,
+        learned_slope=TEST_LEARNED_SLOPE,
+        target_time=get_future_datetime(5),
+        outdoor_temp=outdoor_temp,
+    )
+
+    expected = _expected_duration(current_temp, target_temp, outdoor_temp, TEST_LEARNED_SLOPE)
+    assert result.estimated_duration_minutes == pytest.approx(expected, abs=1e-6)
+
+
+@pytest.mark.parametrize(
+    ("outdoor_temp", "expected_minutes"),
+    [
+        pytest.param(20.0, 95.0, id="reference_outdoor"),  # 90 min + buffer
+        pytest.param(0.0, 185.0, id="cold_doubles_time"),
+        pytest.param(-10.0, 230.0, id="very_cold"),
+        pytest.param(30.0, 50.0, id="warm_floored_at_half"),  # Factor floored at 0.5
+    ],
+)
+def test_reference_duration_ladder(
+    prediction_service: PredictionService,
+    outdoor_temp: float,
+    expected_minutes: float,
+) -> None:
+    """Test hand-computed durations (18°C -> 21°C at 2°C/h) pin the reference formula."""
+    result = prediction_service.predict_heating_time(
+        current_temp=18.0,
+        target_temp=21.0,
+        learned_slope=2.0,
+        target_time=get_future_datetime(5),
+        outdoor_temp=outdoor_temp,
+    )
+
+    assert result.estimated_duration_minutes == pytest.approx(expected_minutes)
+    assert _expected_duration(18.0, 21.0, outdoor_temp, 2.0) == pytest.approx(expected_minutes)
@@ -1,21 +1,10 @@
 """Tests for SlopeData value object."""
 from __future__ import annotations
 
-import os
-import sys
 from datetime import datetime, timezone
 
 import pytest
 
-# Add custom_components to path
-sys.path.insert(
-    0,
-    os.path.join(
-        os.path.dirname(__file__),
-        "../../../custom_components/intelligent_heating_pilot",
-    ),
-)
-
 from domain.value_objects import SlopeData
 
 
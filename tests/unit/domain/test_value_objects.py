@@ -1,21 +1,10 @@
 """Tests for domain value objects."""
 from __future__ import annotations
 
-import os
-import sys
 from datetime import datetime, timezone
 
 import pytest
 
-# Add custom_components to path
-sys.path.insert(
-    0,
-    os.path.join(
-        os.path.dirname(__file__),
-        "../../../custom_components/intelligent_heating_pilot",
-    ),
-)
-
 from domain.value_objects import (
     EnvironmentState,
     ScheduledTimeslot,
@@ -24,10 +13,7 @@ from domain.value_objects import (
     HeatingAction,
 )
 
-# Add current directory to path for fixtures (which is in the same directory)
-sys.path.insert(0, os.path.dirname(__file__))
-
-from fixtures import (
+from .fixtures import (
     get_test_datetime,
     TEST_CURRENT_TEMP,
     TEST_TARGET_TEMP,
@@ -5,7 +5,7 @@ from unittest.mock import AsyncMock, Mock, patch
 import pytest
 from custom_components.intelligent_heating_pilot.infrastructure.adapters.cycle_cache import HACycleCache
 from custom_components.intelligent_heating_pilot.domain.value_objects.heating import HeatingCycle
-from fixtures import create_test_heating_cycle
+from tests.unit.domain.fixtures import create_test_heating_cycle
 
 
 @pytest.fixture
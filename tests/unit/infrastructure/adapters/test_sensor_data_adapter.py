@@ -17,7 +17,8 @@ from tests.unit.domain.fixtures import (
     get_test_datetime,
     get_future_datetime,
     TEST_ENTITY_ID,
-    MOCK_SENSOR_HISTORY_RESPONSE,
+    sensor_events,
+    MOCK_SENSOR_HISTORY,
 )
 
 
@@ -40,7 +41,7 @@ class TestSensorDataAdapter:
         start_time = get_test_datetime()
         end_time = get_future_datetime(hours=1)
 
-        adapter._fetch_history = AsyncMock(return_value=MOCK_SENSOR_HISTORY_RESPONSE[0])
+        adapter._fetch_history = AsyncMock(return_value=MOCK_SENSOR_HISTORY)
 
         result = await adapter.fetch_historical_data(
             TEST_ENTITY_ID,
@@ -58,7 +59,7 @@ class TestSensorDataAdapter:
         start_time = get_test_datetime()
         end_time = get_future_datetime(hours=1)
 
-        adapter._fetch_history = AsyncMock(return_value=MOCK_SENSOR_HISTORY_RESPONSE[0])
+        adapter._fetch_history = AsyncMock(return_value=MOCK_SENSOR_HISTORY)
 
         result = await adapter.fetch_historical_data(
             "some_id",
@@ -84,6 +85,9 @@ class TestSensorDataAdapter:
         # Verify third measurement
         assert outdoor_temps[2].value == 7.0
 
+        # Whole series matches the mocked history, in order
+        assert [m.value for m in outdoor_temps] == [value for _, value, _ in sensor_events()]
+
     @pytest.mark.asyncio
     async def test_fetch_historical_data_uses_provided_data_key(self, adapter):
         """Test that the provided data_key is used to categorize measurements."""
@@ -119,7 +123,7 @@ class TestSensorDataAdapter:
         start_time = get_test_datetime()
         end_time = get_future_datetime(hours=1)
 
-        adapter._fetch_history = AsyncMock(return_value=MOCK_SENSOR_HISTORY_RESPONSE[0])
+        adapter._fetch_history = AsyncMock(return_value=MOCK_SENSOR_HISTORY)
 
         result = await adapter.fetch_historical_data(
             "sensor.outdoor_temp",
@@ -174,7 +178,7 @@ class TestSensorDataAdapter:
         start_time = get_test_datetime()
         end_time = get_future_datetime(hours=1)
 
-        adapter._fetch_history = AsyncMock(return_value=MOCK_SENSOR_HISTORY_RESPONSE[0])
+        adapter._fetch_history = AsyncMock(return_value=MOCK_SENSOR_HISTORY)
 
         result = await adapter.fetch_historical_data(
             "sensor.outdoor_temp",
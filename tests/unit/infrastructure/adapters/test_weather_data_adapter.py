@@ -17,7 +17,8 @@ from tests.unit.domain.fixtures import (
     get_test_datetime,
     get_future_datetime,
     TEST_ENTITY_ID,
-    MOCK_WEATHER_HISTORY_RESPONSE,
+    weather_events,
+    MOCK_WEATHER_HISTORY,
 )
 
 
@@ -40,7 +41,7 @@ class TestWeatherDataAdapter:
         start_time = get_test_datetime()
         end_time = get_future_datetime(hours=1)
 
-        adapter._fetch_history = AsyncMock(return_value=MOCK_WEATHER_HISTORY_RESPONSE[0])
+        adapter._fetch_history = AsyncMock(return_value=MOCK_WEATHER_HISTORY)
 
         result = await adapter.fetch_historical_data(TEST_ENTITY_ID, HistoricalDataKey.OUTDOOR_TEMP, start_time, end_time)
 
@@ -53,7 +54,7 @@ class TestWeatherDataAdapter:
         start_time = get_test_datetime()
         end_time = get_future_datetime(hours=1)
 
-        adapter._fetch_history = AsyncMock(return_value=MOCK_WEATHER_HISTORY_RESPONSE[0])
+        adapter._fetch_history = AsyncMock(return_value=MOCK_WEATHER_HISTORY)
 
         result = await adapter.fetch_historical_data("weather.home", HistoricalDataKey.OUTDOOR_TEMP, start_time, end_time)
 
@@ -74,13 +75,16 @@ class TestWeatherDataAdapter:
         # Verify third measurement
         assert outdoor_temps[2].value == 7.0
 
+        # Whole series matches the mocked history, in order
+        assert [m.value for m in outdoor_temps] == [value for _, value, _ in weather_events()]
+
     @pytest.mark.asyncio
     async def test_fetch_historical_data_extracts_outdoor_humidity(self, adapter):
         """Test that outdoor humidity is correctly extracted from weather data."""
         start_time = get_test_datetime()
         end_time = get_future_datetime(hours=1)
 
-        adapter._fetch_history = AsyncMock(return_value=MOCK_WEATHER_HISTORY_RESPONSE[0])
+        adapter._fetch_history = AsyncMock(return_value=MOCK_WEATHER_HISTORY)
 
         result = await adapter.fetch_historical_data(TEST_ENTITY_ID, HistoricalDataKey.OUTDOOR_HUMIDITY, start_time, end_time)
 
@@ -99,7 +103,7 @@ class TestWeatherDataAdapter:
         start_time = get_test_datetime()
         end_time = get_future_datetime(hours=1)
 
-        adapter._fetch_history = AsyncMock(return_value=MOCK_WEATHER_HISTORY_RESPONSE[0])
+        adapter._fetch_history = AsyncMock(return_value=MOCK_WEATHER_HISTORY)
 
         result = await adapter.fetch_historical_data(TEST_ENTITY_ID, HistoricalDataKey.CLOUD_COVERAGE, start_time, end_time)
 
@@ -118,7 +122,7 @@ class TestWeatherDataAdapter:
         start_time = get_test_datetime()
         end_time = get_future_datetime(hours=1)
 
-        adapter._fetch_history = AsyncMock(return_value=MOCK_WEATHER_HISTORY_RESPONSE[0])
+        adapter._fetch_history = AsyncMock(return_value=MOCK_WEATHER_HISTORY)
 
         result = await adapter.fetch_historical_data(TEST_ENTITY_ID, HistoricalDataKey.OUTDOOR_TEMP, start_time, end_time)
 
@@ -135,7 +139,7 @@ class TestWeatherDataAdapter:
         start_time = get_test_datetime()
         end_time = get_future_datetime(hours=1)
 
-        adapter._fetch_history = AsyncMock(return_value=MOCK_WEATHER_HISTORY_RESPONSE[0])
+        adapter._fetch_history = AsyncMock(return_value=MOCK_WEATHER_HISTORY)
 
         result = await adapter.fetch_historical_data(TEST_ENTITY_ID, HistoricalDataKey.OUTDOOR_TEMP, start_time, end_time)
 
@@ -176,7 +180,7 @@ class TestWeatherDataAdapter:
         start_time = get_test_datetime()
         end_time = get_future_datetime(hours=1)
 
-        adapter._fetch_history = AsyncMock(return_value=MOCK_WEATHER_HISTORY_RESPONSE[0])
+        adapter._fetch_history = AsyncMock(return_value=MOCK_WEATHER_HISTORY)
 
         result = await adapter.fetch_historical_data(TEST_ENTITY_ID, HistoricalDataKey.OUTDOOR_TEMP, start_time, end_time)
 
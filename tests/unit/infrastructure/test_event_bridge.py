@@ -0,0 +1,53 @@
+"""Tests for the anticipation event payload built by the event bridge."""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+
+from custom_components.intelligent_heating_pilot.infrastructure.event_bridge import (
+    build_anticipation_payload,
+)
+
+
+def test_build_anticipation_payload_serializes_datetimes() -> None:
+    """Test payload carries ISO strings and all sensor fields."""
+    # GIVEN: Anticipation data as returned by the application service
+    anticipation_data = {
+        "anticipated_start_time": datetime(2025, 1, 15, 5, 0, tzinfo=timezone.utc),
+        "next_schedule_time": datetime(2025, 1, 15, 6, 30, tzinfo=timezone.utc),
+        "next_target_temperature": 21.0,
+        "anticipation_minutes": 90.0,
+        "current_temp": 18.0,
+        "learned_heating_slope": 2.0,
+        "confidence_level": 0.8,
+        "scheduler_entity": "switch.schedule_morning",
+    }
+
+    # WHEN: Building the event payload
+    payload = build_anticipation_payload("entry_1", anticipation_data)
+
+    # THEN: Datetimes are ISO strings and the entry ID is attached
+    assert payload["entry_id"] == "entry_1"
+    assert payload["anticipated_start_time"] == "2025-01-15T05:00:00+00:00"
+    assert payload["next_schedule_time"] == "2025-01-15T06:30:00+00:00"
+    assert payload["scheduler_entity"] == "switch.schedule_morning"
+    assert "clear_values" not in payload
+
+
+def test_build_anticipation_payload_clear_event() -> None:
+    """Test missing anticipation data produces a clear event."""
+    payload = build_anticipation_payload("entry_1", None)
+
+    assert payload == {"entry_id": "entry_1", "clear_values": True}
+
+
+def test_build_anticipation_payload_is_read_only() -> None:
+    """Test the shared payload cannot be mutated by a listener."""
+    payload = build_anticipation_payload("entry_1", None)
+
+    with pytest.raises(RuntimeError):
+        payload["clear_values"] = False
+
+    # Still a dict so HA can JSON-serialize it for the recorder
+    assert isinstance(payload, dict)